@@ -4,17 +4,19 @@
 
 from abc import ABC, abstractmethod
 from collections.abc import MutableMapping
+from math import isclose, isnan
 from numbers import Number
 from pathlib import Path
 from typing import Iterable, Union
 
-import numpy as np
-
 from protocol import logger
 from protocol.config import (SUPPORTED_IMAGING_MODALITIES,
                              Unspecified, UnspecifiedType)
 from protocol.utils import convert2ascii
 
+# marks a missing entry, as None may be stored as a value
+_MISSING = object()
+
 
 # A [imaging] Parameter is a container class for a single value, with a name
 #       with methods to check for compliance and validity
@@ -64,6 +66,9 @@ class BaseParameter(ABC):
         Acronym of the parameter. For example, 'TR' for RepetitionTime.
     """
 
+    __slots__ = ('required', 'severity', '_value', 'dtype', 'units', 'range',
+                 'steps', 'name', 'acronym', 'dicom_tag', 'decimals')
+
     def __init__(self,
                  name='parameter',
                  value=Unspecified,
@@ -88,7 +93,7 @@ class BaseParameter(ABC):
         name = convert2ascii(name)
         if not name:
             raise ValueError('Parameter name cannot be empty!')
-        self.name = convert2ascii(name)
+        self.name = name
         self.acronym = acronym
         self.dicom_tag = dicom_tag
 
@@ -206,6 +211,8 @@ class MultiValueNumericParameter(BaseParameter):
         Therefore, ordered=True.
     """
 
+    __slots__ = ()
+
     def __init__(self,
                  name,
                  value,
@@ -237,7 +244,7 @@ class MultiValueNumericParameter(BaseParameter):
 
         if not isinstance(value, UnspecifiedType):
             if isinstance(value, Iterable):
-                if not all([isinstance(v, self.dtype) for v in value]):
+                if not all(isinstance(v, self.dtype) for v in value):
                     raise TypeError(f'Input {value} is not of type {self.dtype}'
                                     f' for {self.name}')
                 self._value = [float(v) for v in value]
@@ -278,6 +285,11 @@ class MultiValueNumericParameter(BaseParameter):
         if decimals is None:
             decimals = self.decimals
 
+        # values of different lengths can never match, and zip would
+        # silently truncate the longer one
+        if len(self._value) != len(other._value):
+            return False
+
         # tolerance is 1e-N where N = self.decimals
         for v, o in zip(self._value, other._value):
             # Numpy adds a warning : The default atol is not appropriate for
@@ -285,9 +297,9 @@ class MultiValueNumericParameter(BaseParameter):
             # are much smaller than one (see Notes). Keeping relative tolerance
             # for now.
             # if not np.isclose(v, o, atol=1 ** -self.decimals):
-            v = np.round(v, decimals=decimals)
-            o = np.round(o, decimals=decimals)
-            if not np.isclose(v, o, rtol=rtol):
+            v = round(v, decimals)
+            o = round(o, decimals)
+            if not isclose(v, o, rel_tol=rtol, abs_tol=1e-8):
                 return False
         return True
 
@@ -328,6 +340,8 @@ class NumericParameter(BaseParameter):
         Acronym of the parameter. For example, 'TR' for RepetitionTime.
     """
 
+    __slots__ = ()
+
     def __init__(self,
                  name,
                  value,
@@ -355,7 +369,7 @@ class NumericParameter(BaseParameter):
             if not isinstance(value, self.dtype):
                 raise TypeError(f'Input {value} is not of type {self.dtype} for'
                                 f' {self.name}')
-            if np.isnan(value):
+            if isnan(value):
                 raise ValueError(f'Input {value} is not a valid number for '
                                  f'{self.name}')
             self._value = float(value)
@@ -377,16 +391,13 @@ class NumericParameter(BaseParameter):
             decimals = self.decimals
 
         # tolerance is 1e-N where N = self.decimals
-        # Numpy adds a warning : The default atol is not appropriate for comparing
-        # numbers that
-        # are much smaller than one (see Notes). Keeping relative tolerance for now.
-        # if np.isclose(self._value, other._value, atol=1 ** -self.decimals):
-        v = np.round(self._value, decimals=decimals)
-        o = np.round(other._value, decimals=decimals)
-        if np.isclose(v, o, rtol=rtol):
-            return True
-        else:
-            return False
+        # Both values are scalar floats, so use the builtin round and
+        # math.isclose rather than their numpy counterparts, which have to
+        # wrap each scalar in an array. For the default rtol=0, it is
+        # equivalent to np.isclose with its default atol of 1e-8.
+        v = round(self._value, decimals)
+        o = round(other._value, decimals)
+        return isclose(v, o, rel_tol=rtol, abs_tol=1e-8)
 
     def _compare_units(self, other):
         # TODO: implement unit conversion
@@ -428,6 +439,8 @@ class MultiValueCategoricalParameter(BaseParameter):
         Valid values for the parameter.
     """
 
+    __slots__ = ('allowed_values',)
+
     def __init__(self,
                  name,
                  value,
@@ -473,7 +486,8 @@ class MultiValueCategoricalParameter(BaseParameter):
             # if allowed_values is set, check if input value is allowed
             if self.allowed_values and (value not in self.allowed_values):
                 raise ValueError(f'Invalid value for {self.name}. Got {value} '
-                                 f'Must be one of {self.allowed_values}')
+                                 f'Must be one of '
+                                 f'{sorted(self.allowed_values, key=str)}')
 
     def _check_compliance(self, other, **kwargs):
         """Method to check if one parameter value is compatible w.r.t another,
@@ -525,6 +539,8 @@ class CategoricalParameter(BaseParameter):
         Valid values for the parameter.
     """
 
+    __slots__ = ('allowed_values',)
+
     def __init__(self,
                  name,
                  value,
@@ -569,7 +585,8 @@ class CategoricalParameter(BaseParameter):
             # if allowed_values is set, check if input value is allowed
             if self.allowed_values and (value not in self.allowed_values):
                 raise ValueError(f'Invalid value for {self.name}. Got {value} '
-                                 f'Must be one of {self.allowed_values}')
+                                 f'Must be one of '
+                                 f'{sorted(self.allowed_values, key=str)}')
 
     def _check_compliance(self, other, **kwargs):
         """Method to check if one parameter value is compatible w.r.t another,
@@ -651,6 +668,8 @@ class BaseSequence(MutableMapping):
         self.session_id = None
         self.run_id = None
         self.timestamp = None
+        # cached string of parameter values, reset whenever params change
+        self._repr_cache = None
         if isinstance(params, dict):
             self.params = set(list(params.keys()))
             self.__dict__.update(params)
@@ -676,6 +695,7 @@ class BaseSequence(MutableMapping):
             # retaining full Parameter instance, not just value
             self.__dict__[param.name] = param
             self.params.add(param.name)
+        self._repr_cache = None
 
     def __setitem__(self,
                     key: str,
@@ -690,6 +710,7 @@ class BaseSequence(MutableMapping):
 
         self.__dict__[key] = value
         self.params.add(key)
+        self._repr_cache = None
 
     def get(self, name, not_found_value=None):
         """getter"""
@@ -699,13 +720,13 @@ class BaseSequence(MutableMapping):
                     not_found_value=None):
         """getter"""
 
-        try:
-            return self.__dict__[name]
-        except KeyError:
-            if not_found_value is not None:
-                return not_found_value
-            else:
+        # single lookup; avoids setting up exception state on every miss
+        param = self.__dict__.get(name, _MISSING)
+        if param is _MISSING:
+            if not_found_value is None:
                 raise KeyError(f'{name} has not been set yet')
+            return not_found_value
+        return param
 
     def compliant(self, other, rtol=0, decimals=None, include_params=None):
         """
@@ -787,6 +808,7 @@ class BaseSequence(MutableMapping):
     def __delitem__(self, key):
         del self.__dict__[key]
         self.params.remove(key)
+        self._repr_cache = None
 
     def __iter__(self):
         return iter(self.params)
@@ -797,14 +819,20 @@ class BaseSequence(MutableMapping):
     def __str__(self):
         """human readable representation"""
 
-        plist = list()
-        for key in self.params:
-            param = self.__dict__[key]
-            name = param.acronym if param.acronym else param.name
-            if not isinstance(param.get_value(), UnspecifiedType):
-                plist.append(f'{name}={param.get_value()}')
-
-        return '{}({})'.format(self.name, ','.join(plist))
+        # name may be reset after parsing (e.g. set_session_info), so only
+        #   the parameter listing is cached
+        if self._repr_cache is None:
+            params = self.__dict__
+            plist = list()
+            for key in self.params:
+                param = params[key]
+                value = param.get_value()
+                if not isinstance(value, UnspecifiedType):
+                    name = param.acronym if param.acronym else param.name
+                    plist.append(f'{name}={value}')
+            self._repr_cache = ','.join(plist)
+
+        return f'{self.name}({self._repr_cache})'
 
     def __repr__(self):
         return self.__str__()
@@ -853,6 +881,6 @@ class BaseImagingProtocol(BaseProtocol):
         #   as they touch different portions of DICOM
         if category not in SUPPORTED_IMAGING_MODALITIES:
             raise TypeError(f'This modality {category} not supported.'
-                            f'Choose one of {SUPPORTED_IMAGING_MODALITIES}')
+                            f'Choose one of {sorted(SUPPORTED_IMAGING_MODALITIES)}')
         else:
             self._category = category
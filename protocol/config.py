@@ -1,12 +1,66 @@
 # Do not import anything from protocol modules in this file.
 # It will lead to circular imports. Let it be pristine
+import atexit
+import json
 import logging
+import logging.handlers
+import queue
 import tempfile
-from enum import Enum
+from enum import IntEnum
 from pathlib import Path
+from types import MappingProxyType
 
 
-def configure_logger(log, output_dir, mode='w', level='ERROR'):
+# formatters are shared by every handler created in configure_logger
+_WARN_FORMATTER = logging.Formatter('%(filename)s:%(name)s:%(funcName)s:'
+                                    '%(lineno)d: %(message)s')
+_ERROR_FORMATTER = logging.Formatter('%(asctime)s - %(levelname)s - '
+                                     '%(message)s')
+_LEAN_WARN_FORMATTER = logging.Formatter('%(name)s: %(message)s')
+
+
+class BufferedFileHandler(logging.FileHandler):
+    """FileHandler that writes through a large buffer
+
+    The file is opened on the first record, and the stream is only flushed
+    for ERROR records instead of after every record. Everything else is
+    written when the buffer fills or when the handler is closed.
+    """
+
+    buffer_size = 64 * 1024
+
+    def _open(self):
+        return open(self.baseFilename, self.mode,
+                    buffering=self.buffer_size, encoding=self.encoding)
+
+    def emit(self, record):
+        if self.stream is None:
+            # as in FileHandler, a closed handler in 'w' mode is not reopened,
+            # which would truncate the records already written
+            if self.mode != 'w' or not getattr(self, '_closed', False):
+                self.stream = self._open()
+        if self.stream is None:
+            return
+        try:
+            self.stream.write(self.format(record) + self.terminator)
+            if record.levelno >= logging.ERROR:
+                self.stream.flush()
+        except Exception:
+            self.handleError(record)
+
+
+def _ensure_log_dir(root):
+    """Creates the log folder inside root. The folder may have been removed
+    since the last call, so it is checked every time, which only costs a stat
+    when it exists"""
+    log_dir = Path(root) / '.protocol'
+    if not log_dir.is_dir():
+        log_dir.mkdir(parents=True, exist_ok=True)
+    return log_dir
+
+
+def configure_logger(log, output_dir, mode='w', level='ERROR', capacity=1024,
+                     caller_info=False):
     """
     Initiate log files.
 
@@ -21,16 +75,48 @@ def configure_logger(log, output_dir, mode='w', level='ERROR'):
         The path to the output directory.
     level : str,
         The level of logging to the console. One of ['WARNING', 'ERROR']
+    capacity : int
+        Number of records buffered in memory before they are written to the
+        log file. ERROR records are written immediately.
+    caller_info : bool
+        Whether warnings should include the file, function and line number
+        they were logged from. Formatting these is skipped unless requested.
+        The caller is still looked up for every record, as the records also
+        propagate to the handlers of the application using this package.
+
+    Records are put on a queue by the logger and written to the console and
+    the log file by a background listener thread, so callers never block on
+    file I/O. The listener is stored as ``log._queue_listener`` and stopped
+    at exit, which flushes any pending records.
+
+    Calling it again on the same logger replaces the handlers from the
+    previous call, so records are never written twice. The logger level is
+    set to ``level`` as well, so that calls below it return right away.
+    Callers should pass arguments lazily, e.g.
+    ``logger.info('found %s', name)`` rather than an f-string, so the message
+    is never formatted when the record is dropped.
     """
 
+    previous = getattr(log, '_queue_listener', None)
+    if previous is not None:
+        atexit.unregister(previous.stop)
+        previous.stop()
+        for handler in previous.handlers:
+            # closing a MemoryHandler flushes it, but leaves its target open
+            target = getattr(handler, 'target', None)
+            handler.close()
+            if target is not None:
+                target.close()
+        log.removeHandler(log._queue_handler)
+
     console_handler = logging.StreamHandler()  # creates the handler
-    warn_formatter = ('%(filename)s:%(name)s:%(funcName)s:%(lineno)d:'
-                      ' %(message)s')
-    error_formatter = '%(asctime)s - %(levelname)s - %(message)s'
     if output_dir is None:
         output_dir = tempfile.gettempdir()
-    output_dir = Path(output_dir) / '.protocol'
-    output_dir.mkdir(parents=True, exist_ok=True)
+    output_dir = _ensure_log_dir(str(output_dir))
+    if caller_info:
+        warn_formatter = _WARN_FORMATTER
+    else:
+        warn_formatter = _LEAN_WARN_FORMATTER
 
     options = {
         "warn" : {
@@ -41,7 +127,7 @@ def configure_logger(log, output_dir, mode='w', level='ERROR'):
         "error": {
             'level'    : logging.ERROR,
             'file'     : output_dir / 'error.log',
-            'formatter': error_formatter
+            'formatter': _ERROR_FORMATTER
         }
     }
 
@@ -50,18 +136,38 @@ def configure_logger(log, output_dir, mode='w', level='ERROR'):
     else:
         config = options['warn']
 
-    file_handler = logging.FileHandler(config['file'], mode=mode)
+    file_handler = BufferedFileHandler(config['file'], mode=mode,
+                                       encoding='utf-8', delay=True)
     file_handler.setLevel(config['level'])
-    file_handler.setFormatter(logging.Formatter(config['formatter']))
-    log.addHandler(file_handler)
+    file_handler.setFormatter(config['formatter'])
+    # write records to the file in batches rather than one at a time
+    memory_handler = logging.handlers.MemoryHandler(capacity=capacity,
+                                                    flushLevel=logging.ERROR,
+                                                    target=file_handler,
+                                                    flushOnClose=True)
+    memory_handler.setLevel(config['level'])
 
     console_handler.setLevel(config['level'])  # sets the handler info
-    console_handler.setFormatter(logging.Formatter(config['formatter']))
-    log.addHandler(console_handler)
+    console_handler.setFormatter(config['formatter'])
+
+    # the actual handlers are owned by the listener, the logger only
+    # enqueues records
+    log_queue = queue.Queue(-1)
+    listener = logging.handlers.QueueListener(log_queue,
+                                              memory_handler,
+                                              console_handler,
+                                              respect_handler_level=True)
+    listener.start()
+    atexit.register(listener.stop)
+    log._queue_listener = listener
+
+    log._queue_handler = logging.handlers.QueueHandler(log_queue)
+    log.addHandler(log._queue_handler)
+    log.setLevel(config['level'])
     return log
 
 
-class UnspecifiedType(dict):
+class UnspecifiedType:
     """Class to denote an unspecified value
 
     Reasons include:
@@ -72,12 +178,25 @@ class UnspecifiedType(dict):
         to prevent them from assigning default values or
         imputing them another way!
 
-    It subclasses dict so that it can be exported into a JSON file
+    There is exactly one instance per class, so ``value is Unspecified`` is a
+    valid check. Use ProtocolJSONEncoder to export it into a JSON file.
     """
 
-    def __init__(self):
-        """constructor"""
-        super().__init__()
+    __slots__ = ()
+    _instance = None
+    _hash = hash('Unspecified')
+
+    def __new__(cls):
+        # look up the instance on cls itself, so that subclasses such as
+        # InvalidType get their own singleton rather than the parent's
+        instance = cls.__dict__.get('_instance')
+        if instance is None:
+            instance = super().__new__(cls)
+            cls._instance = instance
+        return instance
+
+    def __bool__(self):
+        return False
 
     def __str__(self):
         return 'Unspecified'
@@ -86,7 +205,7 @@ class UnspecifiedType(dict):
         return 'Unspecified'
 
     def __hash__(self):
-        return hash(str(self))
+        return self._hash
 
 
 class InvalidType(UnspecifiedType):
@@ -100,9 +219,9 @@ class InvalidType(UnspecifiedType):
         to prevent them from assigning default values or imputing them another way!
     """
 
-    def __init__(self):
-        """constructor"""
-        super().__init__()
+    __slots__ = ()
+    _instance = None
+    _hash = hash('InvalidType')
 
     def __str__(self):
         return 'InvalidType'
@@ -111,11 +230,45 @@ class InvalidType(UnspecifiedType):
         return 'InvalidType'
 
 
+class ProtocolJSONEncoder(json.JSONEncoder):
+    """JSON encoder that exports Unspecified and Invalid values as {}
+
+    Examples
+    --------
+
+    .. code :: python
+
+        json.dump(data, fp, cls=ProtocolJSONEncoder)
+    """
+
+    def default(self, o):
+        if isinstance(o, UnspecifiedType):
+            return {}
+        return super().default(o)
+
+
 Unspecified = UnspecifiedType()
 Invalid = InvalidType()
 
+
+def is_unspecified(value):
+    """Checks if value is Unspecified or Invalid.
+
+    Equivalent to ``isinstance(value, UnspecifiedType)``, but as both are
+    singletons, it only needs two identity comparisons.
+    """
+    return value is Unspecified or value is Invalid
+
+
+def is_invalid(value):
+    """Checks if value is Invalid"""
+    return value is Invalid
+
+
 # Constant Dicom Identifiers Used for dataset creation and manipulation
-SESSION_INFO_DICOM_TAGS = {
+# The lookup tables below are read-only views, as they are shared by every
+# parameter class and must not be modified at runtime
+SESSION_INFO_DICOM_TAGS = MappingProxyType({
     "ContentDate"      : (0x08, 0x0023),
     "ContentTime"      : (0x08, 0x0033),
     "SeriesInstanceUID": (0x20, 0x0e),
@@ -132,9 +285,9 @@ SESSION_INFO_DICOM_TAGS = {
     "PatientSize"      : (0x10, 0x1020),
     "OperatorsName"    : (0x08, 0x1070),
     "InstitutionName"  : (0x08, 0x0080),
-}
+})
 
-BASE_IMAGING_PARAMS_DICOM_TAGS = {
+BASE_IMAGING_PARAMS_DICOM_TAGS = MappingProxyType({
     # Hardware Parameters
     'Manufacturer'                  : (0x08, 0x70),
     'ManufacturersModelName'        : (0x08, 0x1090),
@@ -227,9 +380,9 @@ BASE_IMAGING_PARAMS_DICOM_TAGS = {
     "GradientOffsetX"               : (0x43, 0x1002),
     "GradientOffsetY"               : (0x43, 0x1003),
     "GradientOffsetZ"               : (0x43, 0x1004),
-}
+})
 
-ACRONYMS_IMAGING_PARAMETERS = {
+ACRONYMS_IMAGING_PARAMETERS = MappingProxyType({
     'Manufacturer'                  : 'MFR',
     'ManufacturersModelName'        : 'MMN',
     'SoftwareVersions'              : 'SV',
@@ -306,9 +459,16 @@ ACRONYMS_IMAGING_PARAMETERS = {
     'ImageType'                     : 'IT',
     'InPlanePhaseEncodingDirection' : 'PPED',
     'EffectiveEchoSpacing'          : 'EES',
-}
+})
 
-ACRONYMS_DEMOGRAPHICS = {
+# Reverse lookup, acronym to parameter name. 'PS' is used by both
+# PercentSampling and PixelSpacing, the first one listed above is kept
+_acronym_to_param = {}
+for _param, _acronym in ACRONYMS_IMAGING_PARAMETERS.items():
+    _acronym_to_param.setdefault(_acronym, _param)
+ACRONYM_TO_PARAM = MappingProxyType(_acronym_to_param)
+
+ACRONYMS_DEMOGRAPHICS = MappingProxyType({
     "PatientSex"     : "PASX",
     "PatientAge"     : "PAAG",
     "PatientWeight"  : "PAWT",
@@ -318,7 +478,7 @@ ACRONYMS_DEMOGRAPHICS = {
     "SeriesNumber"   : "SSNM",
     "ContentDate"    : "CD",
     "ContentTime"    : "CT",
-}
+})
 
 PARAMETERS_ANALOGUES = {
     'InPlanePhaseEncodingDirection': [
@@ -348,7 +508,24 @@ PARAMETERS_ANALOGUES_DICT = {val: key
                              for key, values in PARAMETERS_ANALOGUES.items()
                              for val in values}
 
-BASE_IMAGING_PARAMETER_NAMES = list(BASE_IMAGING_PARAMS_DICOM_TAGS.keys())
+BASE_IMAGING_PARAMETER_NAMES = tuple(BASE_IMAGING_PARAMS_DICOM_TAGS)
+# position of each name in BASE_IMAGING_PARAMETER_NAMES
+PARAM_INDEX = MappingProxyType({name: idx for idx, name
+                                in enumerate(BASE_IMAGING_PARAMETER_NAMES)})
+
+
+def _tag_keys(tag_table):
+    """Integer form of each tag in tag_table, (group << 16) | element.
+
+    pydicom accepts these directly, which skips converting the
+    (group, element) tuple on every lookup
+    """
+    return MappingProxyType({name: (group << 16) | element
+                             for name, (group, element) in tag_table.items()})
+
+
+BASE_IMAGING_PARAMS_TAG_KEYS = _tag_keys(BASE_IMAGING_PARAMS_DICOM_TAGS)
+SESSION_INFO_TAG_KEYS = _tag_keys(SESSION_INFO_DICOM_TAGS)
 
 # Constant dicom Identifiers used to extract dicom headers
 HEADER_TAGS = {
@@ -390,20 +567,20 @@ SHIM = {
     "4": 'advanced'
 }
 
-ATDict = ["2D", "3D"]
+ATDict = frozenset({"2D", "3D"})
 
-allowed_values_PED = list(['i', 'j', 'k',
-                           'i-', 'j-', 'k-',
-                           'ROW', 'COL'])
+allowed_values_PED = frozenset({'i', 'j', 'k',
+                                'i-', 'j-', 'k-',
+                                'ROW', 'COL'})
 
 # , 'CT', 'PET', 'SPECT', 'US', 'NM', 'MG', 'CR', 'DX', 'OT']
-SUPPORTED_IMAGING_MODALITIES = ['MR']
+SUPPORTED_IMAGING_MODALITIES = frozenset({'MR'})
 
-valid_head_coils = ['HC', 'HEA', 'HEP', 'HHA', 'HHP']
-valid_neck_coils = ['NC', 'NEA', 'NEP']
-valid_spine_coils = ['SP']
+valid_head_coils = frozenset({'HC', 'HEA', 'HEP', 'HHA', 'HHP'})
+valid_neck_coils = frozenset({'NC', 'NEA', 'NEP'})
+valid_spine_coils = frozenset({'SP'})
 
 
-class ProtocolType(Enum):
+class ProtocolType(IntEnum):
     INFERRED_FROM_DATASET = 1
     USER_DEFINED = 2
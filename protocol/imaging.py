@@ -1,86 +1,113 @@
+import functools
 import re
+import sys
 from abc import ABC
 from bisect import insort
 from collections import defaultdict
-from copy import deepcopy
 from datetime import datetime
 from importlib import import_module
+from math import isclose, isnan
 from pathlib import Path
 
-import numpy as np
-import pydicom
-from lxml import objectify
 from protocol import config as cfg, logger
 from protocol.base import (BaseImagingProtocol, BaseParameter, BaseSequence,
                            CategoricalParameter, MultiValueCategoricalParameter,
                            MultiValueNumericParameter, NumericParameter)
 from protocol.config import (ACRONYMS_IMAGING_PARAMETERS as ACRONYMS_IMG,
                              BASE_IMAGING_PARAMS_DICOM_TAGS as DICOM_TAGS,
+                             BASE_IMAGING_PARAMS_TAG_KEYS as DICOM_TAG_KEYS,
                              SESSION_INFO_DICOM_TAGS as SESSION_TAGS,
+                             SESSION_INFO_TAG_KEYS as SESSION_TAG_KEYS,
                              ACRONYMS_DEMOGRAPHICS as ACRONYMS_DEMO,
                              PARAMETERS_ANALOGUES_DICT as ANALOGUES_DICT,
                              Invalid, Unspecified, UnspecifiedType,
                              ProtocolType, valid_neck_coils, INVALID_PARAMETERS)
 from protocol.utils import (auto_convert, convert2ascii, get_dicom_param_value,
-                            get_sequence_name, header_exists,
-                            parse_csa_params, expand_number_range,
-                            get_bids_param_value, read_json)
+                            get_sequence_name, load_header, read_csa_headers,
+                            parse_csa_params, expand_number_range, read_json)
 
+# names of the parameters read for every sequence. Each sequence gets its own
+# copy, which is cheaper to make from a set than from the dict keys
+_IMAGING_PARAMS = frozenset(ACRONYMS_IMG)
+_DEMOGRAPHIC_PARAMS = frozenset(ACRONYMS_DEMO)
 
-class Manufacturer(CategoricalParameter):
-    """
-    Parameter specific class for Manufacturer
-    """
-
-    _name = 'Manufacturer'
-
-    def __init__(self, value=Unspecified):
-        """Constructor."""
-
-        super().__init__(name=self._name,
-                         value=value,
-                         required=True,
-                         severity='optional',
-                         dicom_tag=DICOM_TAGS[self._name],
-                         acronym=ACRONYMS_IMG[self._name])
 
+def _parameter_class(cls_name, base, name=None, dicom_tags=DICOM_TAGS,
+                     acronyms=ACRONYMS_IMG, doc=None, **kwargs):
+    """
+    Creates a parameter specific class, whose constructor only accepts a value.
 
-class ManufacturersModelName(CategoricalParameter):
-    """Parameter specific class for ManufacturersModelName"""
+    Most parameters differ only in the arguments passed to the constructor of
+    their base class, so these are bound once here instead of writing out a
+    class for each of them.
 
-    _name = 'ManufacturersModelName'
+    Parameters
+    ----------
+    cls_name : str
+        Name of the class
+    base : type
+        Parameter class to derive from, e.g. NumericParameter
+    name : str
+        Name of the parameter, if different from the class name
+    dicom_tags : dict
+        Table to look up the DICOM tag of the parameter
+    acronyms : dict
+        Table to look up the acronym of the parameter
+    doc : str
+        Docstring of the class
+    kwargs
+        Arguments passed on to the constructor of base, e.g. units, range.
+        dicom_tag and acronym may be given to override the lookup.
+    """
+    if name is None:
+        name = cls_name
+    if 'dicom_tag' in kwargs:
+        dicom_tag = kwargs.pop('dicom_tag')
+    else:
+        dicom_tag = dicom_tags[name]
+    if 'acronym' in kwargs:
+        acronym = kwargs.pop('acronym')
+    else:
+        acronym = acronyms[name]
 
     def __init__(self, value=Unspecified):
         """Constructor."""
+        super(cls, self).__init__(name=self._name, value=value,
+                                  dicom_tag=self._dicom_tag,
+                                  acronym=self._acronym, **kwargs)
 
-        super().__init__(name=self._name,
-                         value=value,
-                         required=True,
-                         severity='optional',
-                         dicom_tag=DICOM_TAGS[self._name],
-                         acronym=ACRONYMS_IMG[self._name])
+    if doc is None:
+        doc = f'Parameter specific class for {name}'
+    cls = type(cls_name, (base,), {'__doc__'   : doc,
+                                   '__module__': __name__,
+                                   '_name'     : name,
+                                   '_dicom_tag': dicom_tag,
+                                   '_acronym'  : acronym,
+                                   '__slots__' : (),
+                                   '__init__'  : __init__})
+    return cls
 
 
-class SoftwareVersions(CategoricalParameter):
-    """Parameter specific class for SoftwareVersions"""
+# TODO verify the accuracy of the ranges of numeric parameters
+Manufacturer = _parameter_class('Manufacturer', CategoricalParameter,
+                                required=True, severity='optional')
 
-    _name = 'SoftwareVersions'
+ManufacturersModelName = _parameter_class('ManufacturersModelName',
+                                          CategoricalParameter, required=True,
+                                          severity='optional')
 
-    def __init__(self, value=Unspecified):
-        """Constructor."""
-
-        super().__init__(name=self._name,
-                         value=value,
-                         required=True,
-                         severity='optional',
-                         dicom_tag=DICOM_TAGS[self._name],
-                         acronym=ACRONYMS_IMG[self._name])
+SoftwareVersions = _parameter_class('SoftwareVersions', CategoricalParameter,
+                                    required=True, severity='optional')
 
 
 class MagneticFieldStrength(NumericParameter):
     """Parameter specific class for MagneticFieldStrength"""
 
+    __slots__ = ()
+
     _name = 'MagneticFieldStrength'
+    _dicom_tag = DICOM_TAGS[_name]
+    _acronym = ACRONYMS_IMG[_name]
 
     def __init__(self, value=Unspecified):
         """Constructor."""
@@ -99,45 +126,37 @@ class MagneticFieldStrength(NumericParameter):
                          # TODO verify the accuracy of this range
                          required=True,
                          severity='critical',
-                         dicom_tag=DICOM_TAGS[self._name],
-                         acronym=ACRONYMS_IMG[self._name])
-
-
-class ReceiveCoilName(CategoricalParameter):
-    """Parameter specific class for ReceiveCoilName"""
-
-    _name = 'ReceiveCoilName'
+                         dicom_tag=self._dicom_tag,
+                         acronym=self._acronym)
 
-    def __init__(self, value=Unspecified):
-        """Constructor."""
 
-        super().__init__(name=self._name,
-                         value=value,
-                         required=True,
-                         severity='optional',
-                         dicom_tag=DICOM_TAGS[self._name],
-                         acronym=ACRONYMS_IMG[self._name])
+ReceiveCoilName = _parameter_class('ReceiveCoilName', CategoricalParameter,
+                                   required=True, severity='optional')
 
 
 class ReceiveCoilActiveElements(CategoricalParameter):
     """Parameter specific class for ReceiveCoilName"""
 
+    __slots__ = ('_coil_str',)
+
     _name = 'ReceiveCoilActiveElements'
+    _dicom_tag = DICOM_TAGS[_name]
+    _acronym = ACRONYMS_IMG[_name]
 
     def __init__(self, value=Unspecified):
         """Constructor."""
         if not isinstance(value, UnspecifiedType):
             value = self.parse(value)
         else:
-            self.__dict__['__str__'] = str(value)
+            self._coil_str = str(value)
 
         super().__init__(name=self._name,
                          value=value,
                          dtype=dict,
                          required=True,
                          severity='optional',
-                         dicom_tag=DICOM_TAGS[self._name],
-                         acronym=ACRONYMS_IMG[self._name])
+                         dicom_tag=self._dicom_tag,
+                         acronym=self._acronym)
 
     def parse(self, value):
         coil_dict = {}
@@ -174,7 +193,7 @@ class ReceiveCoilActiveElements(CategoricalParameter):
             else:
                 break
 
-        self.__dict__['__str__'] = coil_info
+        self._coil_str = coil_info
         # cast defaultdict to dict
         coil_dict = dict(parsed_values)
         return coil_dict
@@ -183,8 +202,8 @@ class ReceiveCoilActiveElements(CategoricalParameter):
         """repr"""
         name = self.acronym if self.acronym else self.name
         try:
-            return f"{name}({self.__dict__['__str__']})"
-        except KeyError:
+            return f"{name}({self._coil_str})"
+        except AttributeError:
             return f"{name}({self._value})"
 
     def get_value(self):
@@ -200,1191 +219,372 @@ class ReceiveCoilActiveElements(CategoricalParameter):
         if kwargs.get('body_part_examined', None):
             bpe = kwargs['body_part_examined']
             if not isinstance(bpe, UnspecifiedType):
-                if bpe in ['HEAD', 'BRAIN']:
+                if bpe in ('HEAD', 'BRAIN'):
                     ignore_list.extend(valid_neck_coils)
                     # ignore_list.extend(valid_spine_coils)
 
-        # noinspection PyArgumentList
-        return (self._compare_value(other, ignore_list=ignore_list)
-                and self._compare_units(other))
-
-    def _compare_value(self, other, **kwargs):
-        ref_dict = self.get_value()
-        other_dict = other.get_value()
-        # TODO: check if the both have the a coil
-        #  corresponding to the same body part from BODY_PART_EXAMINED
-        if str(self) == str(other):
-            # if complete string matches, return True
-            return True
-        else:
-            # check if the coil names match and the numbers match
-            coil_names_union = set(ref_dict.keys()).union(set(other_dict.keys()))
-            ignore_list = kwargs.get('ignore_list', [])
-            compare_coils = coil_names_union.difference(ignore_list)
-
-            for coil_name in compare_coils:
-                if coil_name not in ref_dict:
-                    return False
-                if coil_name not in other_dict:
-                    return False
-                # if ref_dict[coil_name] != other_dict[coil_name]:
-                #     return False
-            return True
-
-
-class MRTransmitCoilSequence(CategoricalParameter):
-    """Parameter specific class for MRTransmitCoilSequence"""
-
-    _name = 'MRTransmitCoilSequence'
-
-    def __init__(self, value=Unspecified):
-        """Constructor."""
-
-        super().__init__(name=self._name,
-                         value=value,
-                         required=True,
-                         severity='optional',
-                         dicom_tag=DICOM_TAGS[self._name],
-                         acronym=ACRONYMS_IMG[self._name])
-
-
-class SequenceVariant(MultiValueCategoricalParameter):
-    """Parameter specific class for SequenceVariant"""
-
-    _name = 'SequenceVariant'
-
-    def __init__(self, value=Unspecified):
-        """Constructor."""
-
-        super().__init__(name=self._name,
-                         value=value,
-                         required=True,
-                         severity='optional',
-                         dicom_tag=DICOM_TAGS[self._name],
-                         acronym=ACRONYMS_IMG[self._name])
-
-
-class ScanOptions(CategoricalParameter):
-    """Parameter specific class for ScanOptions"""
-
-    _name = 'ScanOptions'
-
-    def __init__(self, value=Unspecified):
-        """Constructor."""
-
-        super().__init__(name=self._name,
-                         value=value,
-                         required=True,
-                         severity='optional',
-                         dicom_tag=DICOM_TAGS[self._name],
-                         acronym=ACRONYMS_IMG[self._name])
-
-
-class SequenceName(CategoricalParameter):
-    """Parameter specific class for SequenceName"""
-
-    _name = 'SequenceName'
-
-    def __init__(self, value=Unspecified):
-        """Constructor."""
-
-        super().__init__(name=self._name,
-                         value=value,
-                         required=True,
-                         severity='optional',
-                         dicom_tag=DICOM_TAGS[self._name],
-                         acronym=ACRONYMS_IMG[self._name])
-
-
-class ImageType(MultiValueCategoricalParameter):
-    """Parameter specific class for ImageType"""
-
-    _name = 'ImageType'
-
-    def __init__(self, value=Unspecified):
-        """Constructor."""
-
-        super().__init__(name=self._name,
-                         value=value,
-                         required=True,
-                         severity='optional',
-                         dicom_tag=DICOM_TAGS[self._name],
-                         acronym=ACRONYMS_IMG[self._name])
-
-
-class NonLinearGradientCorrection(CategoricalParameter):
-    """Parameter specific class for NonLinearGradientCorrection"""
-
-    _name = 'NonLinearGradientCorrection'
-
-    def __init__(self, value=Unspecified):
-        """Constructor."""
-        nlgc = self.parse(value)
-        super().__init__(name=self._name,
-                         value=nlgc,
-                         dtype=bool,
-                         required=True,
-                         severity='optional',
-                         dicom_tag=DICOM_TAGS[self._name],
-                         acronym=ACRONYMS_IMG[self._name])
-
-    def parse(self, value):
-        if not isinstance(value, UnspecifiedType):
-            if isinstance(value, list):
-                for i in value:
-                    if i in ['DIS2D', 'DIS3D']:
-                        return True
-                    elif i in ['ND']:
-                        return False
-            elif isinstance(value, bool):
-                return value
-            else:
-                raise ValueError("Expected a boolean value or Iterable.")
-        return value
-
-
-class MRAcquisitionType(CategoricalParameter):
-    """Parameter specific class for MRAcquisitionType"""
-
-    _name = 'MRAcquisitionType'
-
-    def __init__(self, value=Unspecified):
-        """Constructor."""
-
-        super().__init__(name=self._name,
-                         value=value,
-                         required=True,
-                         severity='optional',
-                         dicom_tag=DICOM_TAGS[self._name],
-                         acronym=ACRONYMS_IMG[self._name])
-
-
-class MTState(CategoricalParameter):
-    """Parameter specific class for MTState"""
-
-    _name = 'MTState'
-
-    def __init__(self, value=Unspecified):
-        """Constructor."""
-
-        super().__init__(name=self._name,
-                         value=value,
-                         required=True,
-                         severity='optional',
-                         dicom_tag=DICOM_TAGS[self._name],
-                         acronym=ACRONYMS_IMG[self._name])
-
-
-class SpoilingState(CategoricalParameter):
-    """Parameter specific class for SpoilingState"""
-
-    _name = 'SpoilingState'
-
-    def __init__(self, value=Unspecified):
-        """Constructor."""
-
-        super().__init__(name=self._name,
-                         value=value,
-                         required=True,
-                         severity='optional',
-                         dicom_tag=DICOM_TAGS[self._name],
-                         acronym=ACRONYMS_IMG[self._name])
-
-
-class ParallelReductionFactorInPlane(NumericParameter):
-    """Parameter specific class for ParallelReductionFactorInPlane"""
-
-    _name = 'ParallelReductionFactorInPlane'
-
-    def __init__(self, value=Unspecified):
-        """Constructor."""
-
-        super().__init__(name=self._name,
-                         value=value,
-                         units='NA',
-                         range=(0, 100),
-                         # TODO verify the accuracy of this range
-                         required=True,
-                         severity='critical',
-                         dicom_tag=DICOM_TAGS[self._name],
-                         acronym=ACRONYMS_IMG[self._name])
-
-
-class ParallelAcquisitionTechnique(NumericParameter):
-    """Parameter specific class for ParallelAcquisitionTechnique"""
-
-    _name = 'ParallelAcquisitionTechnique'
-
-    def __init__(self, value=Unspecified):
-        """Constructor."""
-
-        super().__init__(name=self._name,
-                         value=value,
-                         units='NA',
-                         range=(0, 100),
-                         # TODO verify the accuracy of this range
-                         required=True,
-                         severity='critical',
-                         dicom_tag=DICOM_TAGS[self._name],
-                         acronym=ACRONYMS_IMG[self._name])
-
-
-class PartialFourier(NumericParameter):
-    """Parameter specific class for PartialFourier"""
-
-    _name = 'PartialFourier'
-
-    def __init__(self, value=Unspecified):
-        """Constructor."""
-
-        super().__init__(name=self._name,
-                         value=value,
-                         units='NA',
-                         range=(0, 100),
-                         # TODO verify the accuracy of this range
-                         required=True,
-                         severity='critical',
-                         dicom_tag=DICOM_TAGS[self._name],
-                         acronym=ACRONYMS_IMG[self._name])
-
-
-class PartialFourierDirection(NumericParameter):
-    """Parameter specific class for PartialFourierDirection"""
-
-    _name = 'PartialFourierDirection'
-
-    def __init__(self, value=Unspecified):
-        """Constructor."""
-
-        super().__init__(name=self._name,
-                         value=value,
-                         units='NA',
-                         range=(0, 100),
-                         # TODO verify the accuracy of this range
-                         required=True,
-                         severity='critical',
-                         dicom_tag=DICOM_TAGS[self._name],
-                         acronym=ACRONYMS_IMG[self._name])
-
-
-class DwellTime(NumericParameter):
-    """Parameter specific class for DwellTime"""
-
-    _name = 'DwellTime'
-
-    def __init__(self, value=Unspecified):
-        """Constructor."""
-
-        super().__init__(name=self._name,
-                         value=value,
-                         units='s',
-                         range=(0, 100),
-                         # TODO verify the accuracy of this range
-                         required=True,
-                         severity='critical',
-                         dicom_tag=DICOM_TAGS[self._name],
-                         acronym=ACRONYMS_IMG[self._name])
-
-
-class MultibandAccelerationFactor(NumericParameter):
-    """Parameter specific class for MultibandAccelerationFactor"""
-
-    _name = 'MultibandAccelerationFactor'
-
-    def __init__(self, value=Unspecified):
-        """Constructor."""
-
-        super().__init__(name=self._name,
-                         value=value,
-                         units='NA',
-                         range=(0, 100),
-                         # TODO verify the accuracy of this range
-                         required=True,
-                         severity='critical',
-                         dicom_tag=DICOM_TAGS[self._name],
-                         acronym=ACRONYMS_IMG[self._name])
-
-
-class EchoTrainLength(NumericParameter):
-    """Parameter specific class for EchoTrainLength"""
-
-    _name = 'EchoTrainLength'
-
-    def __init__(self, value=Unspecified):
-        """Constructor."""
-
-        super().__init__(name=self._name,
-                         value=value,
-                         units='NA',
-                         range=(0, 100),
-                         # TODO verify the accuracy of this range
-                         required=True,
-                         severity='critical',
-                         dicom_tag=DICOM_TAGS[self._name],
-                         acronym=ACRONYMS_IMG[self._name])
-
-
-class PixelBandwidth(NumericParameter):
-    """Parameter specific class for PixelBandwidth"""
-
-    _name = 'PixelBandwidth'
-
-    def __init__(self, value=Unspecified):
-        """Constructor."""
-
-        super().__init__(name=self._name,
-                         value=value,
-                         units='Hz',
-                         range=(0, 100000),
-                         # TODO verify the accuracy of this range
-                         required=True,
-                         severity='critical',
-                         dicom_tag=DICOM_TAGS[self._name],
-                         acronym=ACRONYMS_IMG[self._name])
-
-
-class PhaseEncodingSteps(NumericParameter):
-    """Parameter specific class for PhaseEncodingSteps"""
-
-    _name = 'PhaseEncodingSteps'
-
-    def __init__(self, value=Unspecified):
-        """Constructor."""
-
-        super().__init__(name=self._name,
-                         value=value,
-                         units='NA',
-                         range=(0, 100000),
-                         # TODO verify the accuracy of this range
-                         required=True,
-                         severity='critical',
-                         dicom_tag=DICOM_TAGS[self._name],
-                         acronym=ACRONYMS_IMG[self._name])
-
-
-class ShimSetting(MultiValueNumericParameter):
-    """Parameter specific class for ShimSetting"""
-
-    _name = 'ShimSetting'
-
-    def __init__(self, value=Unspecified):
-        """Constructor."""
-
-        super().__init__(name=self._name,
-                         value=value,
-                         units='NA',
-                         range=(0, 100000),
-                         # TODO verify the accuracy of this range
-                         required=True,
-                         severity='critical',
-                         dicom_tag=None,
-                         acronym=ACRONYMS_IMG[self._name],
-                         ordered=True)
-
-
-class ShimMode(CategoricalParameter):
-    """Parameter specific class for ShimSetting"""
-
-    _name = 'ShimMode'
-
-    def __init__(self, value=Unspecified):
-        """Constructor."""
-
-        super().__init__(name=self._name,
-                         value=value,
-                         required=True,
-                         severity='critical',
-                         dicom_tag=None,
-                         acronym=ACRONYMS_IMG[self._name])
-
-
-class MultiSliceMode(CategoricalParameter):
-    """Parameter specific class for MultiSliceMode"""
-
-    _name = 'MultiSliceMode'
-
-    def __init__(self, value=Unspecified):
-        """Constructor."""
-
-        super().__init__(name=self._name,
-                         value=value,
-                         required=True,
-                         severity='critical',
-                         dicom_tag=None,
-                         acronym=ACRONYMS_IMG[self._name])
-
-
-class EchoNumber(NumericParameter):
-    """Parameter specific class for EchoNumber"""
-
-    _name = 'EchoNumber'
-
-    def __init__(self, value=Unspecified):
-        """Constructor."""
-
-        super().__init__(name=self._name,
-                         value=value,
-                         units='NA',
-                         range=(0, 100000),
-                         # TODO verify the accuracy of this range
-                         required=True,
-                         severity='critical',
-                         dicom_tag=DICOM_TAGS[self._name],
-                         acronym=ACRONYMS_IMG[self._name])
-
-
-class RepetitionTime(NumericParameter):
-    """Parameter specific class for RepetitionTime"""
-
-    _name = 'RepetitionTime'
-
-    def __init__(self, value=Unspecified):
-        """Constructor."""
-
-        super().__init__(name=self._name,
-                         value=value,
-                         units='ms',
-                         range=(0, 100000),
-                         # TODO verify the accuracy of this range
-                         required=True,
-                         severity='critical',
-                         dicom_tag=DICOM_TAGS[self._name],
-                         acronym=ACRONYMS_IMG[self._name])
-
-
-class FlipAngle(NumericParameter):
-    """Parameter specific class for FlipAngle"""
-
-    _name = "FlipAngle"
-
-    def __init__(self, value=Unspecified):
-        """constructor"""
-
-        super().__init__(name=self._name,
-                         value=value,
-                         units='degrees',
-                         range=(0, 360),
-                         required=True,
-                         severity='critical',
-                         dicom_tag=DICOM_TAGS[self._name],
-                         acronym=ACRONYMS_IMG[self._name])
-
-        # overriding default from parent class
-        self.decimals = 0
-
-        # acceptable range could be achieved with different levels of tolerance
-        #   from +/- 5 degrees to +/- 20 degrees
-        self.abs_tolerance = 0  # degrees
-
-
-class MultiValueEchoTime(MultiValueNumericParameter):
-    """Parameter specific class for EchoTime"""
-
-    _name = "EchoTime"
-
-    def __init__(self, value=Unspecified):
-        """constructor"""
-
-        super().__init__(name=self._name,
-                         value=value,
-                         units='ms',
-                         range=(0, 10000),
-                         required=True,
-                         severity='critical',
-                         dicom_tag=DICOM_TAGS[self._name],
-                         acronym=ACRONYMS_IMG[self._name])
-
-
-class EchoTime(MultiValueNumericParameter):
-    """Parameter specific class for EchoTime"""
-
-    _name = "EchoTime"
-
-    def __init__(self, value=Unspecified):
-        """constructor"""
-
-        super().__init__(name=self._name,
-                         value=value,
-                         units='ms',
-                         range=(0, 10000),
-                         required=True,
-                         severity='critical',
-                         dicom_tag=DICOM_TAGS[self._name],
-                         acronym=ACRONYMS_IMG[self._name])
-
-
-class MultiValueEchoNumber(MultiValueNumericParameter):
-    """Parameter specific class for EchoTime"""
-
-    _name = "EchoNumber"
-
-    def __init__(self, value=Unspecified):
-        """constructor"""
-
-        super().__init__(name=self._name,
-                         value=value,
-                         units='ms',
-                         range=(0, 10000),
-                         required=True,
-                         severity='critical',
-                         dicom_tag=DICOM_TAGS[self._name],
-                         acronym=ACRONYMS_IMG[self._name])
-
-
-class EffectiveEchoSpacing(NumericParameter):
-    """Parameter specific class for EffectiveEchoSpacing"""
-
-    _name = "EffectiveEchoSpacing"
-
-    def __init__(self, value=Unspecified):
-        """constructor"""
-
-        super().__init__(name=self._name,
-                         value=value,
-                         units='mm',
-                         range=(0, 1000),
-                         required=False,
-                         severity='critical',
-                         dicom_tag=None,
-                         acronym=ACRONYMS_IMG[self._name])
-
-
-class PhaseEncodingDirection(CategoricalParameter):
-    """Parameter specific class for PhaseEncodingDirection"""
-
-    _name = 'PhaseEncodingDirection'
-
-    def __init__(self, value=Unspecified):
-        """Constructor."""
-
-        super().__init__(name=self._name,
-                         value=value,
-                         dicom_tag=DICOM_TAGS[self._name],
-                         acronym=ACRONYMS_IMG[self._name],
-                         allowed_values=cfg.allowed_values_PED)
-
-
-class InPlanePhaseEncodingDirection(CategoricalParameter):
-    """Parameter specific class for InPlanePhaseEncodingDirection"""
-
-    _name = 'InPlanePhaseEncodingDirection'
-
-    def __init__(self, value=Unspecified):
-        """Constructor."""
-
-        super().__init__(name=self._name,
-                         value=value,
-                         dicom_tag=DICOM_TAGS[self._name],
-                         acronym=ACRONYMS_IMG[self._name],
-                         allowed_values=['ROW', 'COL'])
-
-
-class ScanningSequence(CategoricalParameter):
-    """Parameter specific class for """
-
-    _name = 'ScanningSequence'
-
-    def __init__(self, value=Unspecified):
-        """Constructor."""
-
-        super().__init__(name=self._name,
-                         value=value,
-                         dicom_tag=DICOM_TAGS[self._name],
-                         acronym=ACRONYMS_IMG[self._name])
-
-
-class PhasePolarity(CategoricalParameter):
-    """Parameter specific class for """
-
-    _name = 'PhasePolarity'
-
-    def __init__(self, value=Unspecified):
-        """Constructor."""
-
-        super().__init__(name=self._name,
-                         value=value,
-                         dtype=int,
-                         dicom_tag=None,
-                         acronym=ACRONYMS_IMG[self._name])
-
-
-class InversionTime(NumericParameter):
-    """Parameter specific class for InversionTime"""
-
-    _name = 'InversionTime'
-
-    def __init__(self, value=Unspecified):
-        """Constructor."""
-
-        super().__init__(name=self._name,
-                         value=value,
-                         units='ms',
-                         range=(0, 100000),
-                         # TODO verify the accuracy of this range
-                         required=True,
-                         severity='critical',
-                         dicom_tag=DICOM_TAGS[self._name],
-                         acronym=ACRONYMS_IMG[self._name])
-
-
-class BodyPartExamined(CategoricalParameter):
-    """Parameter specific class for BodyPartExamined"""
-
-    _name = 'BodyPartExamined'
-
-    def __init__(self, value=Unspecified):
-        """Constructor."""
-
-        super().__init__(name=self._name,
-                         value=value,
-                         dicom_tag=DICOM_TAGS[self._name],
-                         acronym=ACRONYMS_IMG[self._name])
-
-
-class PercentPhaseFOV(NumericParameter):
-    """Parameter specific class for PercentPhaseFOV"""
-
-    _name = 'PercentPhaseFOV'
-
-    def __init__(self, value=Unspecified):
-        """Constructor."""
-
-        super().__init__(name=self._name,
-                         value=value,
-                         units='%',
-                         range=(0, 100),
-                         required=True,
-                         severity='critical',
-                         dicom_tag=DICOM_TAGS[self._name],
-                         acronym=ACRONYMS_IMG[self._name])
-
-
-class NumberOfAverages(NumericParameter):
-    _name = 'NumberOfAverages'
-
-    def __init__(self, value=Unspecified):
-        """Constructor."""
-
-        super().__init__(name=self._name,
-                         value=value,
-                         units='NA',
-                         range=(0, 100000),
-                         required=True,
-                         severity='critical',
-                         dicom_tag=DICOM_TAGS[self._name],
-                         acronym=ACRONYMS_IMG[self._name])
-
-
-class SliceThickness(NumericParameter):
-    _name = 'SliceThickness'
-
-    def __init__(self, value=Unspecified):
-        """Constructor."""
-
-        super().__init__(name=self._name,
-                         value=value,
-                         units='mm',
-                         range=(0, 1000),
-                         required=True,
-                         severity='critical',
-                         dicom_tag=DICOM_TAGS[self._name],
-                         acronym=ACRONYMS_IMG[self._name])
-
-
-class PercentSampling(NumericParameter):
-    _name = 'PercentSampling'
-
-    def __init__(self, value=Unspecified):
-        """Constructor."""
-
-        super().__init__(name=self._name,
-                         value=value,
-                         units='%',
-                         range=(0, 100),
-                         required=True,
-                         severity='critical',
-                         dicom_tag=DICOM_TAGS[self._name],
-                         acronym=ACRONYMS_IMG[self._name])
-
-
-class AngioFlag(CategoricalParameter):
-    _name = 'AngioFlag'
-
-    def __init__(self, value=Unspecified):
-        """Constructor."""
-
-        super().__init__(name=self._name,
-                         value=value,
-                         dtype=str,
-                         dicom_tag=DICOM_TAGS[self._name],
-                         acronym=ACRONYMS_IMG[self._name])
-
-
-class ImagingFrequency(NumericParameter):
-    _name = 'ImagingFrequency'
-
-    def __init__(self, value=Unspecified):
-        """Constructor."""
-
-        super().__init__(name=self._name,
-                         value=value,
-                         units='Hz',
-                         range=(0, 100000),
-                         required=True,
-                         severity='critical',
-                         dicom_tag=DICOM_TAGS[self._name],
-                         acronym=ACRONYMS_IMG[self._name])
-
-
-class ImagedNucleus(CategoricalParameter):
-    _name = 'ImagedNucleus'
-
-    def __init__(self, value=Unspecified):
-        """Constructor."""
-
-        super().__init__(name=self._name,
-                         value=value,
-                         dtype=str,
-                         dicom_tag=DICOM_TAGS[self._name],
-                         acronym=ACRONYMS_IMG[self._name])
-
-
-class SpacingBetweenSlices(NumericParameter):
-    _name = 'SpacingBetweenSlices'
-
-    def __init__(self, value=Unspecified):
-        """Constructor."""
-
-        super().__init__(name=self._name,
-                         value=value,
-                         units='mm',
-                         range=(0, 1000),
-                         required=True,
-                         severity='critical',
-                         dicom_tag=DICOM_TAGS[self._name],
-                         acronym=ACRONYMS_IMG[self._name])
-
-
-class TransmitCoilName(CategoricalParameter):
-    _name = 'TransmitCoilName'
-
-    def __init__(self, value=Unspecified):
-        """Constructor."""
-
-        super().__init__(name=self._name,
-                         value=value,
-                         dtype=str,
-                         dicom_tag=DICOM_TAGS[self._name],
-                         acronym=ACRONYMS_IMG[self._name])
-
-
-class AcquisitionMatrix(MultiValueNumericParameter):
-    _name = 'AcquisitionMatrix'
-
-    def __init__(self, value=Unspecified):
-        """Constructor"""
-
-        super().__init__(name=self._name,
-                         value=value,
-                         units='NA',
-                         range=(0, 100000),
-                         required=True,
-                         severity='critical',
-                         dicom_tag=DICOM_TAGS[self._name],
-                         acronym=ACRONYMS_IMG[self._name])
-
-
-class SAR(NumericParameter):
-    _name = 'SAR'
-
-    def __init__(self, value=Unspecified):
-        """Constructor"""
-
-        super().__init__(name=self._name,
-                         value=value,
-                         units='W/kg',
-                         range=(0, 100000),
-                         required=True,
-                         severity='critical',
-                         dicom_tag=DICOM_TAGS[self._name],
-                         acronym=ACRONYMS_IMG[self._name])
-
-
-class SliceMeasurementDuration(NumericParameter):
-    _name = 'SliceMeasurementDuration'
-
-    def __init__(self, value=Unspecified):
-        """Constructor"""
-
-        super().__init__(name=self._name,
-                         value=value,
-                         units='s',
-                         range=(0, 100000),
-                         required=True,
-                         severity='critical',
-                         dicom_tag=DICOM_TAGS[self._name],
-                         acronym=ACRONYMS_IMG[self._name])
-
-
-class GradientMode(CategoricalParameter):
-    _name = 'GradientMode'
-
-    def __init__(self, value=Unspecified):
-        """Constructor"""
-
-        super().__init__(name=self._name,
-                         value=value,
-                         dtype=str,
-                         dicom_tag=DICOM_TAGS[self._name],
-                         acronym=ACRONYMS_IMG[self._name])
-
-
-class FlowCompensation(CategoricalParameter):
-    _name = 'FlowCompensation'
-
-    def __init__(self, value=Unspecified):
-        """Constructor"""
-
-        super().__init__(name=self._name,
-                         value=value,
-                         dtype=str,
-                         dicom_tag=DICOM_TAGS[self._name],
-                         acronym=ACRONYMS_IMG[self._name])
-
-
-class SliceResolution(NumericParameter):
-    _name = 'SliceResolution'
+        # noinspection PyArgumentList
+        return (self._compare_value(other, ignore_list=ignore_list)
+                and self._compare_units(other))
 
-    def __init__(self, value=Unspecified):
-        """Constructor"""
+    def _compare_value(self, other, **kwargs):
+        ref_dict = self.get_value()
+        other_dict = other.get_value()
+        # TODO: check if the both have the a coil
+        #  corresponding to the same body part from BODY_PART_EXAMINED
+        if str(self) == str(other):
+            # if complete string matches, return True
+            return True
+        else:
+            # check if the coil names match and the numbers match
+            coil_names_union = set(ref_dict.keys()).union(set(other_dict.keys()))
+            ignore_list = kwargs.get('ignore_list', [])
+            compare_coils = coil_names_union.difference(ignore_list)
 
-        super().__init__(name=self._name,
-                         value=value,
-                         units='NA',
-                         range=(0, 100000),
-                         required=True,
-                         severity='critical',
-                         dicom_tag=None,
-                         acronym=ACRONYMS_IMG[self._name])
+            for coil_name in compare_coils:
+                if coil_name not in ref_dict:
+                    return False
+                if coil_name not in other_dict:
+                    return False
+                # if ref_dict[coil_name] != other_dict[coil_name]:
+                #     return False
+            return True
 
 
-class ImagePositionPatient(MultiValueNumericParameter):
-    _name = 'ImagePositionPatient'
+MRTransmitCoilSequence = _parameter_class('MRTransmitCoilSequence',
+                                          CategoricalParameter, required=True,
+                                          severity='optional')
 
-    def __init__(self, value=Unspecified):
-        """Constructor"""
+SequenceVariant = _parameter_class('SequenceVariant',
+                                   MultiValueCategoricalParameter,
+                                   required=True, severity='optional')
 
-        super().__init__(name=self._name,
-                         value=value,
-                         units='NA',
-                         range=(0, 100000),
-                         required=True,
-                         severity='critical',
-                         dicom_tag=None,
-                         acronym=ACRONYMS_IMG[self._name])
+ScanOptions = _parameter_class('ScanOptions', CategoricalParameter,
+                               required=True, severity='optional')
 
+SequenceName = _parameter_class('SequenceName', CategoricalParameter,
+                                required=True, severity='optional')
 
-class PatientPosition(CategoricalParameter):
-    _name = 'PatientPosition'
+ImageType = _parameter_class('ImageType', MultiValueCategoricalParameter,
+                             required=True, severity='optional')
 
-    def __init__(self, value=Unspecified):
-        """Constructor"""
 
-        super().__init__(name=self._name,
-                         value=value,
-                         dtype=str,
-                         dicom_tag=DICOM_TAGS[self._name],
-                         acronym=ACRONYMS_IMG[self._name])
+class NonLinearGradientCorrection(CategoricalParameter):
+    """Parameter specific class for NonLinearGradientCorrection"""
 
+    __slots__ = ()
 
-class SliceLocation(NumericParameter):
-    _name = 'SliceLocation'
+    _name = 'NonLinearGradientCorrection'
+    _dicom_tag = DICOM_TAGS[_name]
+    _acronym = ACRONYMS_IMG[_name]
 
     def __init__(self, value=Unspecified):
-        """Constructor"""
-
+        """Constructor."""
+        nlgc = self.parse(value)
         super().__init__(name=self._name,
-                         value=value,
-                         units='NA',
-                         range=(0, 100000),
+                         value=nlgc,
+                         dtype=bool,
                          required=True,
-                         severity='critical',
-                         dicom_tag=DICOM_TAGS[self._name],
-                         acronym=ACRONYMS_IMG[self._name])
+                         severity='optional',
+                         dicom_tag=self._dicom_tag,
+                         acronym=self._acronym)
+
+    def parse(self, value):
+        if not isinstance(value, UnspecifiedType):
+            if isinstance(value, list):
+                for i in value:
+                    if i in ['DIS2D', 'DIS3D']:
+                        return True
+                    elif i in ['ND']:
+                        return False
+            elif isinstance(value, bool):
+                return value
+            else:
+                raise ValueError("Expected a boolean value or Iterable.")
+        return value
 
 
-class SamplesPerPixel(NumericParameter):
-    _name = 'SamplesPerPixel'
+MRAcquisitionType = _parameter_class('MRAcquisitionType', CategoricalParameter,
+                                     required=True, severity='optional')
 
-    def __init__(self, value=Unspecified):
-        """Constructor"""
+MTState = _parameter_class('MTState', CategoricalParameter, required=True,
+                           severity='optional')
 
-        super().__init__(name=self._name,
-                         value=value,
-                         units='NA',
-                         range=(0, 100000),
-                         required=True,
-                         severity='critical',
-                         dicom_tag=DICOM_TAGS[self._name],
-                         acronym=ACRONYMS_IMG[self._name])
+SpoilingState = _parameter_class('SpoilingState', CategoricalParameter,
+                                 required=True, severity='optional')
 
+ParallelReductionFactorInPlane = _parameter_class('ParallelReductionFactorInPlane',
+                                                  NumericParameter, units='NA',
+                                                  range=(0, 100),
+                                                  required=True,
+                                                  severity='critical')
 
-class PhotometricInterpretation(CategoricalParameter):
-    _name = 'PhotometricInterpretation'
+ParallelAcquisitionTechnique = _parameter_class('ParallelAcquisitionTechnique',
+                                                NumericParameter, units='NA',
+                                                range=(0, 100), required=True,
+                                                severity='critical')
 
-    def __init__(self, value=Unspecified):
-        """Constructor"""
+PartialFourier = _parameter_class('PartialFourier', NumericParameter,
+                                  units='NA', range=(0, 100), required=True,
+                                  severity='critical')
 
-        super().__init__(name=self._name,
-                         value=value,
-                         dtype=str,
-                         dicom_tag=DICOM_TAGS[self._name],
-                         acronym=ACRONYMS_IMG[self._name])
+PartialFourierDirection = _parameter_class('PartialFourierDirection',
+                                           NumericParameter, units='NA',
+                                           range=(0, 100), required=True,
+                                           severity='critical')
 
+DwellTime = _parameter_class('DwellTime', NumericParameter, units='s',
+                             range=(0, 100), required=True,
+                             severity='critical')
 
-class Rows(NumericParameter):
-    _name = 'Rows'
+MultibandAccelerationFactor = _parameter_class('MultibandAccelerationFactor',
+                                               NumericParameter, units='NA',
+                                               range=(0, 100), required=True,
+                                               severity='critical')
 
-    def __init__(self, value=Unspecified):
-        """Constructor"""
+EchoTrainLength = _parameter_class('EchoTrainLength', NumericParameter,
+                                   units='NA', range=(0, 100), required=True,
+                                   severity='critical')
 
-        super().__init__(name=self._name,
-                         value=value,
-                         units='NA',
-                         range=(0, 100000),
-                         required=True,
-                         severity='critical',
-                         dicom_tag=DICOM_TAGS[self._name],
-                         acronym=ACRONYMS_IMG[self._name])
+PixelBandwidth = _parameter_class('PixelBandwidth', NumericParameter,
+                                  units='Hz', range=(0, 100000), required=True,
+                                  severity='critical')
 
+PhaseEncodingSteps = _parameter_class('PhaseEncodingSteps', NumericParameter,
+                                      units='NA', range=(0, 100000),
+                                      required=True, severity='critical')
 
-class Columns(NumericParameter):
-    _name = 'Columns'
+ShimSetting = _parameter_class('ShimSetting', MultiValueNumericParameter,
+                               units='NA', range=(0, 100000), required=True,
+                               severity='critical', dicom_tag=None,
+                               ordered=True)
 
-    def __init__(self, value=Unspecified):
-        """Constructor"""
+ShimMode = _parameter_class('ShimMode', CategoricalParameter, required=True,
+                            severity='critical', dicom_tag=None)
 
-        super().__init__(name=self._name,
-                         value=value,
-                         units='NA',
-                         range=(0, 100000),
-                         required=True,
-                         severity='critical',
-                         dicom_tag=DICOM_TAGS[self._name],
-                         acronym=ACRONYMS_IMG[self._name])
+MultiSliceMode = _parameter_class('MultiSliceMode', CategoricalParameter,
+                                  required=True, severity='critical',
+                                  dicom_tag=None)
 
+EchoNumber = _parameter_class('EchoNumber', NumericParameter, units='NA',
+                              range=(0, 100000), required=True,
+                              severity='critical')
 
-class PixelSpacing(MultiValueNumericParameter):
-    _name = 'PixelSpacing'
+RepetitionTime = _parameter_class('RepetitionTime', NumericParameter,
+                                  units='ms', range=(0, 100000), required=True,
+                                  severity='critical')
 
-    def __init__(self, value=Unspecified):
-        """Constructor"""
 
-        super().__init__(name=self._name,
-                         value=value,
-                         units='mm',
-                         range=(0, 100000),
-                         required=True,
-                         severity='critical',
-                         dicom_tag=DICOM_TAGS[self._name],
-                         acronym=ACRONYMS_IMG[self._name])
+class FlipAngle(NumericParameter):
+    """Parameter specific class for FlipAngle"""
 
+    __slots__ = ('abs_tolerance',)
 
-class BitsAllocated(NumericParameter):
-    _name = 'BitsAllocated'
+    _name = "FlipAngle"
+    _dicom_tag = DICOM_TAGS[_name]
+    _acronym = ACRONYMS_IMG[_name]
 
     def __init__(self, value=Unspecified):
-        """Constructor"""
+        """constructor"""
 
         super().__init__(name=self._name,
                          value=value,
-                         units='NA',
-                         range=(0, 100000),
+                         units='degrees',
+                         range=(0, 360),
                          required=True,
                          severity='critical',
-                         dicom_tag=DICOM_TAGS[self._name],
-                         acronym=ACRONYMS_IMG[self._name])
+                         dicom_tag=self._dicom_tag,
+                         acronym=self._acronym)
 
+        # overriding default from parent class
+        self.decimals = 0
 
-class BitsStored(NumericParameter):
-    _name = 'BitsStored'
+        # acceptable range could be achieved with different levels of tolerance
+        #   from +/- 5 degrees to +/- 20 degrees
+        self.abs_tolerance = 0  # degrees
 
-    def __init__(self, value=Unspecified):
-        """Constructor"""
 
-        super().__init__(name=self._name,
-                         value=value,
-                         units='NA',
-                         range=(0, 100),
-                         required=True,
-                         severity='critical',
-                         dicom_tag=DICOM_TAGS[self._name],
-                         acronym=ACRONYMS_IMG[self._name])
+MultiValueEchoTime = _parameter_class('MultiValueEchoTime',
+                                      MultiValueNumericParameter,
+                                      name='EchoTime', units='ms',
+                                      range=(0, 10000), required=True,
+                                      severity='critical')
 
+EchoTime = _parameter_class('EchoTime', MultiValueNumericParameter, units='ms',
+                            range=(0, 10000), required=True,
+                            severity='critical')
 
-class HighBit(NumericParameter):
-    _name = 'HighBit'
+MultiValueEchoNumber = _parameter_class('MultiValueEchoNumber',
+                                        MultiValueNumericParameter,
+                                        name='EchoNumber', units='ms',
+                                        range=(0, 10000), required=True,
+                                        severity='critical')
 
-    def __init__(self, value=Unspecified):
-        """Constructor"""
+EffectiveEchoSpacing = _parameter_class('EffectiveEchoSpacing',
+                                        NumericParameter, units='mm',
+                                        range=(0, 1000), required=False,
+                                        severity='critical', dicom_tag=None)
 
-        super().__init__(name=self._name,
-                         value=value,
-                         units='',
-                         range=(0, 100),
-                         required=True,
-                         severity='critical',
-                         dicom_tag=DICOM_TAGS[self._name],
-                         acronym=ACRONYMS_IMG[self._name])
+PhaseEncodingDirection = _parameter_class('PhaseEncodingDirection',
+                                          CategoricalParameter,
+                                          allowed_values=cfg.allowed_values_PED)
 
+InPlanePhaseEncodingDirection = _parameter_class('InPlanePhaseEncodingDirection',
+                                                 CategoricalParameter,
+                                                 allowed_values=('ROW', 'COL'))
 
-class PixelRepresentation(NumericParameter):
-    _name = 'PixelRepresentation'
+ScanningSequence = _parameter_class('ScanningSequence', CategoricalParameter)
 
-    def __init__(self, value=Unspecified):
-        """Constructor"""
+PhasePolarity = _parameter_class('PhasePolarity', CategoricalParameter,
+                                 dtype=int, dicom_tag=None)
 
-        super().__init__(name=self._name,
-                         value=value,
-                         units='',
-                         range=(0, 100),
-                         required=True,
-                         severity='critical',
-                         dicom_tag=DICOM_TAGS[self._name],
-                         acronym=ACRONYMS_IMG[self._name])
+InversionTime = _parameter_class('InversionTime', NumericParameter, units='ms',
+                                 range=(0, 100000), required=True,
+                                 severity='critical')
 
+BodyPartExamined = _parameter_class('BodyPartExamined', CategoricalParameter)
 
-class SmallestImagePixelValue(NumericParameter):
-    _name = 'SmallestImagePixelValue'
+PercentPhaseFOV = _parameter_class('PercentPhaseFOV', NumericParameter,
+                                   units='%', range=(0, 100), required=True,
+                                   severity='critical')
 
-    def __init__(self, value=Unspecified):
-        """Constructor"""
+NumberOfAverages = _parameter_class('NumberOfAverages', NumericParameter,
+                                    units='NA', range=(0, 100000),
+                                    required=True, severity='critical')
 
-        super().__init__(name=self._name,
-                         value=value,
-                         units='',
-                         range=(0, 100000),
-                         required=True,
-                         severity='critical',
-                         dicom_tag=DICOM_TAGS[self._name],
-                         acronym=ACRONYMS_IMG[self._name])
+SliceThickness = _parameter_class('SliceThickness', NumericParameter,
+                                  units='mm', range=(0, 1000), required=True,
+                                  severity='critical')
 
+PercentSampling = _parameter_class('PercentSampling', NumericParameter,
+                                   units='%', range=(0, 100), required=True,
+                                   severity='critical')
 
-class LargestImagePixelValue(NumericParameter):
-    _name = 'LargestImagePixelValue'
+AngioFlag = _parameter_class('AngioFlag', CategoricalParameter, dtype=str)
 
-    def __init__(self, value=Unspecified):
-        """Constructor"""
+ImagingFrequency = _parameter_class('ImagingFrequency', NumericParameter,
+                                    units='Hz', range=(0, 100000),
+                                    required=True, severity='critical')
 
-        super().__init__(name=self._name,
-                         value=value,
-                         units='',
-                         range=(0, 100000),
-                         required=True,
-                         severity='critical',
-                         dicom_tag=DICOM_TAGS[self._name],
-                         acronym=ACRONYMS_IMG[self._name])
+ImagedNucleus = _parameter_class('ImagedNucleus', CategoricalParameter,
+                                 dtype=str)
 
+SpacingBetweenSlices = _parameter_class('SpacingBetweenSlices',
+                                        NumericParameter, units='mm',
+                                        range=(0, 1000), required=True,
+                                        severity='critical')
 
-class WindowCenter(NumericParameter):
-    _name = 'WindowCenter'
+TransmitCoilName = _parameter_class('TransmitCoilName', CategoricalParameter,
+                                    dtype=str)
 
-    def __init__(self, value=Unspecified):
-        """Constructor"""
+AcquisitionMatrix = _parameter_class('AcquisitionMatrix',
+                                     MultiValueNumericParameter, units='NA',
+                                     range=(0, 100000), required=True,
+                                     severity='critical')
 
-        super().__init__(name=self._name,
-                         value=value,
-                         units='',
-                         range=(0, 100000),
-                         required=True,
-                         severity='critical',
-                         dicom_tag=DICOM_TAGS[self._name],
-                         acronym=ACRONYMS_IMG[self._name])
+SAR = _parameter_class('SAR', NumericParameter, units='W/kg',
+                       range=(0, 100000), required=True, severity='critical')
 
+SliceMeasurementDuration = _parameter_class('SliceMeasurementDuration',
+                                            NumericParameter, units='s',
+                                            range=(0, 100000), required=True,
+                                            severity='critical')
 
-class WindowWidth(NumericParameter):
-    _name = 'WindowWidth'
+GradientMode = _parameter_class('GradientMode', CategoricalParameter,
+                                dtype=str)
 
-    def __init__(self, value=Unspecified):
-        """Constructor"""
+FlowCompensation = _parameter_class('FlowCompensation', CategoricalParameter,
+                                    dtype=str)
 
-        super().__init__(name=self._name,
-                         value=value,
-                         units='',
-                         range=(0, 100000),
-                         required=True,
-                         severity='critical',
-                         dicom_tag=DICOM_TAGS[self._name],
-                         acronym=ACRONYMS_IMG[self._name])
+SliceResolution = _parameter_class('SliceResolution', NumericParameter,
+                                   units='NA', range=(0, 100000),
+                                   required=True, severity='critical',
+                                   dicom_tag=None)
 
+ImagePositionPatient = _parameter_class('ImagePositionPatient',
+                                        MultiValueNumericParameter, units='NA',
+                                        range=(0, 100000), required=True,
+                                        severity='critical', dicom_tag=None)
 
-class WindowCenterWidthExplanation(CategoricalParameter):
-    _name = 'WindowCenterWidthExplanation'
+PatientPosition = _parameter_class('PatientPosition', CategoricalParameter,
+                                   dtype=str)
 
-    def __init__(self, value=Unspecified):
-        """Constructor"""
+SliceLocation = _parameter_class('SliceLocation', NumericParameter, units='NA',
+                                 range=(0, 100000), required=True,
+                                 severity='critical')
 
-        super().__init__(name=self._name,
-                         value=value,
-                         dtype=str,
-                         dicom_tag=DICOM_TAGS[self._name],
-                         acronym=ACRONYMS_IMG[self._name])
+SamplesPerPixel = _parameter_class('SamplesPerPixel', NumericParameter,
+                                   units='NA', range=(0, 100000),
+                                   required=True, severity='critical')
 
+PhotometricInterpretation = _parameter_class('PhotometricInterpretation',
+                                             CategoricalParameter, dtype=str)
 
-class CoilString(CategoricalParameter):
-    _name = 'CoilString'
+Rows = _parameter_class('Rows', NumericParameter, units='NA',
+                        range=(0, 100000), required=True, severity='critical')
 
-    def __init__(self, value=Unspecified):
-        """Constructor"""
+Columns = _parameter_class('Columns', NumericParameter, units='NA',
+                           range=(0, 100000), required=True,
+                           severity='critical')
 
-        super().__init__(name=self._name,
-                         value=value,
-                         dtype=str,
-                         dicom_tag=DICOM_TAGS[self._name],
-                         acronym=ACRONYMS_IMG[self._name])
+PixelSpacing = _parameter_class('PixelSpacing', MultiValueNumericParameter,
+                                units='mm', range=(0, 100000), required=True,
+                                severity='critical')
 
+BitsAllocated = _parameter_class('BitsAllocated', NumericParameter, units='NA',
+                                 range=(0, 100000), required=True,
+                                 severity='critical')
 
-class PATMode(CategoricalParameter):
-    _name = 'PATMode'
+BitsStored = _parameter_class('BitsStored', NumericParameter, units='NA',
+                              range=(0, 100), required=True,
+                              severity='critical')
 
-    def __init__(self, value=Unspecified):
-        """Constructor"""
+HighBit = _parameter_class('HighBit', NumericParameter, units='',
+                           range=(0, 100), required=True, severity='critical')
 
-        super().__init__(name=self._name,
-                         value=value,
-                         dtype=str,
-                         dicom_tag=DICOM_TAGS[self._name],
-                         acronym=ACRONYMS_IMG[self._name])
+PixelRepresentation = _parameter_class('PixelRepresentation', NumericParameter,
+                                       units='', range=(0, 100), required=True,
+                                       severity='critical')
 
+SmallestImagePixelValue = _parameter_class('SmallestImagePixelValue',
+                                           NumericParameter, units='',
+                                           range=(0, 100000), required=True,
+                                           severity='critical')
 
-class PositivePCSDirections(CategoricalParameter):
-    _name = 'PositivePCSDirections'
+LargestImagePixelValue = _parameter_class('LargestImagePixelValue',
+                                          NumericParameter, units='',
+                                          range=(0, 100000), required=True,
+                                          severity='critical')
 
-    def __init__(self, value=Unspecified):
-        """Constructor"""
+WindowCenter = _parameter_class('WindowCenter', NumericParameter, units='',
+                                range=(0, 100000), required=True,
+                                severity='critical')
 
-        super().__init__(name=self._name,
-                         value=value,
-                         dtype=str,
-                         dicom_tag=DICOM_TAGS[self._name],
-                         acronym=ACRONYMS_IMG[self._name])
+WindowWidth = _parameter_class('WindowWidth', NumericParameter, units='',
+                               range=(0, 100000), required=True,
+                               severity='critical')
 
+WindowCenterWidthExplanation = _parameter_class('WindowCenterWidthExplanation',
+                                                CategoricalParameter,
+                                                dtype=str)
 
-class VariableFlipAngleFlag(CategoricalParameter):
-    _name = 'VariableFlipAngleFlag'
+CoilString = _parameter_class('CoilString', CategoricalParameter, dtype=str)
 
-    def __init__(self, value=Unspecified):
-        """Constructor."""
+PATMode = _parameter_class('PATMode', CategoricalParameter, dtype=str)
 
-        super().__init__(name=self._name,
-                         value=value,
-                         dtype=str,
-                         dicom_tag=DICOM_TAGS[self._name],
-                         acronym=ACRONYMS_IMG[self._name])
+PositivePCSDirections = _parameter_class('PositivePCSDirections',
+                                         CategoricalParameter, dtype=str)
+
+VariableFlipAngleFlag = _parameter_class('VariableFlipAngleFlag',
+                                         CategoricalParameter, dtype=str)
 
 
 class ImageOrientationPatient(MultiValueNumericParameter):
+    __slots__ = ()
+
     _name = 'ImageOrientationPatient'
+    _dicom_tag = DICOM_TAGS[_name]
+    _acronym = ACRONYMS_IMG[_name]
 
     def __init__(self, value=Unspecified):
         """Constructor."""
@@ -1393,8 +593,8 @@ class ImageOrientationPatient(MultiValueNumericParameter):
 
         super().__init__(name=self._name,
                          value=value,
-                         dicom_tag=DICOM_TAGS[self._name],
-                         acronym=ACRONYMS_IMG[self._name],
+                         dicom_tag=self._dicom_tag,
+                         acronym=self._acronym,
                          ordered=True)
         self.decimals = 0
 
@@ -1408,156 +608,98 @@ class ImageOrientationPatient(MultiValueNumericParameter):
         """getter"""
         if not isinstance(self._value, UnspecifiedType):
             # Add 0.0 will avoid -0.0
-            return [0.0 + np.round(v, self.decimals) for v in self._value]
+            return [0.0 + round(v, self.decimals) for v in self._value]
         return self._value
 
     def _compare_value(self, other, rtol=0, decimals=None):
         # Fix ImageOrientationPatient comparison to 0 decimals
         decimals = self.decimals
 
+        if len(self._value) != len(other._value):
+            return False
+
         for v, o in zip(self._value, other._value):
             # Numpy adds a warning : The default atol is not appropriate for
             # comparing numbers that
             # are much smaller than one (see Notes). Keeping relative tolerance
             # for now.
             # if not np.isclose(v, o, atol=1 ** -self.decimals):
-            v = np.round(v, decimals=decimals)
-            o = np.round(o, decimals=decimals)
-            if not np.isclose(v, o, rtol=rtol):
+            v = round(v, decimals)
+            o = round(o, decimals)
+            if not isclose(v, o, rel_tol=rtol, abs_tol=1e-8):
                 return False
         return True
 
 
-class FieldOfView(CategoricalParameter):
-    _name = 'FieldOfView'
+FieldOfView = _parameter_class('FieldOfView', CategoricalParameter, dtype=str)
 
-    def __init__(self, value=Unspecified):
-        """Constructor."""
-        super().__init__(name=self._name,
-                         value=value,
-                         dtype=str,
-                         dicom_tag=DICOM_TAGS[self._name],
-                         acronym=ACRONYMS_IMG[self._name])
+
+def _content_date(date):
+    """Converts a DICOM date (VR DA) to a datetime. DICOM dates are
+    YYYYMMDD, slicing them is much faster than having strptime parse the
+    format for every file"""
+    if len(date) != 8 or not date.isdigit():
+        raise ValueError(f'ContentDate {date!r} is not in the YYYYMMDD format')
+    return datetime(int(date[:4]), int(date[4:6]), int(date[6:]))
 
 
 class ContentDate(CategoricalParameter):
     """Parameter specific class for BodyPartExamined"""
 
+    __slots__ = ()
+
     _name = 'ContentDate'
+    _dicom_tag = SESSION_TAGS[_name]
+    _acronym = ACRONYMS_DEMO[_name]
 
     def __init__(self, value=Unspecified):
         """Constructor."""
         if not isinstance(value, UnspecifiedType):
-            value = datetime.strptime(str(int(value)), '%Y%m%d')
+            value = _content_date(str(int(value)))
         super().__init__(name=self._name,
                          value=value,
                          dtype=datetime,
-                         dicom_tag=SESSION_TAGS[self._name],
-                         acronym=ACRONYMS_DEMO[self._name])
-
-
-class ContentTime(CategoricalParameter):
-    """Parameter specific class for BodyPartExamined"""
-
-    _name = 'ContentTime'
-
-    def __init__(self, value=Unspecified):
-        """Constructor."""
-        # if not isinstance(value, UnspecifiedType):
-        #     value = datetime.strptime(str(int(value)), '%Y%m%d')
-        super().__init__(name=self._name,
-                         value=value,
-                         dtype=str,
-                         dicom_tag=SESSION_TAGS[self._name],
-                         acronym=ACRONYMS_DEMO[self._name])
-
-
-class PatientSex(CategoricalParameter):
-    """Parameter specific class for BodyPartExamined"""
-
-    _name = 'PatientSex'
-
-    def __init__(self, value=Unspecified):
-        """Constructor."""
-        super().__init__(name=self._name,
-                         value=value,
-                         dtype=str,
-                         dicom_tag=SESSION_TAGS[self._name],
-                         acronym=ACRONYMS_DEMO[self._name],
-                         allowed_values=('M', 'F', 'O'))
-
-
-class PatientWeight(NumericParameter):
-    _name = 'PatientWeight'
-
-    def __init__(self, value=Unspecified):
-        """Constructor."""
-        super().__init__(name=self._name,
-                         value=value,
-                         units='kg',
-                         range=(0, 1e7),
-                         required=False,
-                         severity='critical',
-                         dicom_tag=SESSION_TAGS[self._name],
-                         acronym=ACRONYMS_DEMO[self._name])
+                         dicom_tag=self._dicom_tag,
+                         acronym=self._acronym)
 
 
-class PatientSize(NumericParameter):
-    _name = 'PatientSize'
+ContentTime = _parameter_class('ContentTime', CategoricalParameter, dtype=str,
+                               dicom_tags=SESSION_TAGS, acronyms=ACRONYMS_DEMO)
 
-    def __init__(self, value=Unspecified):
-        """Constructor."""
-        super().__init__(name=self._name,
-                         value=value,
-                         units='m',
-                         range=(0, 1e7),
-                         required=False,
-                         severity='critical',
-                         dicom_tag=SESSION_TAGS[self._name],
-                         acronym=ACRONYMS_DEMO[self._name])
-
-
-class OperatorsName(CategoricalParameter):
-    _name = 'OperatorsName'
+PatientSex = _parameter_class('PatientSex', CategoricalParameter, dtype=str,
+                              dicom_tags=SESSION_TAGS, acronyms=ACRONYMS_DEMO,
+                              allowed_values=('M', 'F', 'O'))
 
-    def __init__(self, value=Unspecified):
-        """Constructor."""
-        super().__init__(name=self._name,
-                         value=value,
-                         dtype=str,
-                         dicom_tag=SESSION_TAGS[self._name],
-                         acronym=ACRONYMS_DEMO[self._name])
+PatientWeight = _parameter_class('PatientWeight', NumericParameter, units='kg',
+                                 range=(0, 1e7), required=False,
+                                 severity='critical', dicom_tags=SESSION_TAGS,
+                                 acronyms=ACRONYMS_DEMO)
 
+PatientSize = _parameter_class('PatientSize', NumericParameter, units='m',
+                               range=(0, 1e7), required=False,
+                               severity='critical', dicom_tags=SESSION_TAGS,
+                               acronyms=ACRONYMS_DEMO)
 
-class InstitutionName(CategoricalParameter):
-    _name = 'InstitutionName'
-
-    def __init__(self, value=Unspecified):
-        """Constructor."""
-        super().__init__(name=self._name,
-                         value=value,
-                         dtype=str,
-                         dicom_tag=SESSION_TAGS[self._name],
-                         acronym=ACRONYMS_DEMO[self._name])
-
+OperatorsName = _parameter_class('OperatorsName', CategoricalParameter,
+                                 dtype=str, dicom_tags=SESSION_TAGS,
+                                 acronyms=ACRONYMS_DEMO)
 
-class SeriesNumber(NumericParameter):
-    _name = 'SeriesNumber'
+InstitutionName = _parameter_class('InstitutionName', CategoricalParameter,
+                                   dtype=str, dicom_tags=SESSION_TAGS,
+                                   acronyms=ACRONYMS_DEMO)
 
-    def __init__(self, value=Unspecified):
-        """Constructor."""
-        super().__init__(name=self._name,
-                         value=value,
-                         units='NA',
-                         range=(0, 1e7),
-                         required=False,
-                         severity='critical',
-                         dicom_tag=SESSION_TAGS[self._name],
-                         acronym=ACRONYMS_DEMO[self._name])
+SeriesNumber = _parameter_class('SeriesNumber', NumericParameter, units='NA',
+                                range=(0, 1e7), required=False,
+                                severity='critical', dicom_tags=SESSION_TAGS,
+                                acronyms=ACRONYMS_DEMO)
 
 
 class PatientAge(NumericParameter):
+    __slots__ = ()
+
     _name = 'PatientAge'
+    _dicom_tag = SESSION_TAGS[_name]
+    _acronym = ACRONYMS_DEMO[_name]
 
     # Prefer birthdate for age calculation
     # https://groups.google.com/g/comp.protocols.dicom/c/GvClri1CcWk # noqa
@@ -1574,8 +716,8 @@ class PatientAge(NumericParameter):
                          range=(0, 999),
                          required=False,
                          severity='critical',
-                         dicom_tag=SESSION_TAGS[self._name],
-                         acronym=ACRONYMS_DEMO[self._name])
+                         dicom_tag=self._dicom_tag,
+                         acronym=self._acronym)
 
     def convert(self, value):
         age = value
@@ -1600,6 +742,25 @@ class PatientAge(NumericParameter):
         return age
 
 
+# units that may trail a value in the exported protocol, see _get_value_and_unit
+_UNIT_SUFFIXES = ('ms', 'mm', 'deg', 'Hz/Px', '%')
+
+# paths in the Siemens protocol XML, relative to PrintTOC / PrintProtocol
+_XPATH_HEADER_TITLE = 'string(TOC/HeaderTitle)'
+_XPATH_PROGRAMS = 'TOC/root/region/NormalExam_dot_engine/*'
+_XPATH_SUBSTEPS = 'Protocol/SubStep'
+_XPATH_HEADER_PATH = 'string(ProtHeaderInfo/HeaderProtPath)'
+_XPATH_HEADER_PROPERTY = 'string(ProtHeaderInfo/HeaderProperty)'
+
+
+@functools.lru_cache(maxsize=None)
+def _xpath(path):
+    """Compiles an XPath expression once. lxml is imported on first use, so
+    that it is only loaded when a protocol XML is actually read"""
+    from lxml import etree
+    return etree.XPath(path)
+
+
 class MRImagingProtocol(BaseImagingProtocol):
     """Base class for all MR imaging protocols, including neuroimaging datasets
     """
@@ -1655,18 +816,10 @@ class MRImagingProtocol(BaseImagingProtocol):
 
     @staticmethod
     def _get_value_and_unit(v):
-        value, unit = v, None
-        if v.endswith('ms'):
-            value, unit = v.split('ms')[0], 'ms'
-        elif v.endswith('mm'):
-            value, unit = v.split('mm')[0], 'mm'
-        elif v.endswith('deg'):
-            value, unit = v.split('deg')[0], 'deg'
-        elif v.endswith('Hz/Px'):
-            value, unit = v.split('Hz/Px')[0], 'Hz/Px'
-        elif v.endswith('%'):
-            value, unit = v.split('%')[0], '%'
-        return value.strip(), unit
+        for unit in _UNIT_SUFFIXES:
+            if v.endswith(unit):
+                return v[:-len(unit)].strip(), unit
+        return v.strip(), None
 
     def add_sequence_from_dict(self, seq_name, param_dict):
         """
@@ -1727,6 +880,10 @@ class MRImagingProtocol(BaseImagingProtocol):
 
 
 class SiemensMRImagingProtocol(MRImagingProtocol):
+    # phase encoding directions as shown in the XML, and their DICOM analogue
+    _PED_TO_DICOM = {'A >> P': 'COL', 'P >> A': 'COL',
+                     'R >> L': 'ROW', 'L >> R': 'ROW'}
+
     def __init__(self, name='SiemensMRProtocol',
                  category='MR',
                  filepath=None,
@@ -1768,18 +925,19 @@ class SiemensMRImagingProtocol(MRImagingProtocol):
             # there is more than one protocol file in the XML
             # specify the number of protocol
             # we are taking the first one, assuming it is the latest
-            self.program_name = list(self.programs.keys())[0]
+            self.program_name = next(iter(self.programs))
             # raise ValueError('Program name not set. Use set_program_name() to
             # set it')
-        for sequence_name in self.programs[self.program_name].keys():
+        for sequence_name, cards in self.programs[self.program_name].items():
             seq = DicomImagingSequence(name=sequence_name)
-            parameters = {}
-            for param_name in self._parameter_map.keys():
-                parameters[param_name] = self._get_parameter(sequence_name,
-                                                             param_name)
-            seq.from_dict(parameters)
+            seq.from_dict(self._extract_all_parameters(cards))
             self.add(seq)
 
+    def _extract_all_parameters(self, cards):
+        """Collects the values of all mapped parameters of a sequence"""
+        return {name: self._lookup(cards, name, access_keys)
+                for name, access_keys in self._parameter_map.items()}
+
     def set_program_name(self, program_name):
         self.program_name = program_name
 
@@ -1787,43 +945,37 @@ class SiemensMRImagingProtocol(MRImagingProtocol):
         self._parameter_map[parameter_name] = access_keys
 
     def get_program_names(self):
+        """Returns a live view of the program names, as read from the XML"""
         return self.programs.keys()
 
     def _get_parameter(self, sequence_name, parameter_name):
-        def get_value(programs, program_name, sequence_name, access_keys):
-            # recursively get the value
-            access_keys = deepcopy(access_keys)
-            root_ = programs[program_name][sequence_name]
-            while access_keys:
-                key = access_keys.pop(0)
-                try:
-                    root_ = root_[key]
-                except KeyError as e:
-                    logger.info(
-                        f'Parameter not found in the sequence {sequence_name}.')
-                    raise e
-            return root_
-
         if self.program_name is None:
             raise ValueError(
                 'Program name not set. Use set_program_name() to set it')
 
         try:
             access_keys = self._parameter_map[parameter_name]
-            value = get_value(self.programs, self.program_name, sequence_name,
-                              access_keys)
+            cards = self.programs[self.program_name][sequence_name]
         except KeyError:
             logger.info(f'Parameter not found : {parameter_name}')
             return Unspecified
+        return self._lookup(cards, parameter_name, access_keys)
+
+    def _lookup(self, cards, parameter_name, access_keys):
+        """Walks down the cards of a sequence to the value of a parameter"""
+        value = cards
+        try:
+            for key in access_keys:
+                value = value[key]
+        except KeyError:
+            # not every sequence has every card, so this is expected
+            logger.debug(f'Parameter not found : {parameter_name}')
+            return Unspecified
 
         # convert PED to DICOM tags
         if parameter_name == 'PhaseEncodingDirection' and self.convert_ped:
-            if value == 'A >> P' or value == 'P >> A':
-                return 'COL'
-            if value == 'R >> L' or value == 'L >> R':
-                return 'ROW'
-        else:
-            return value
+            return self._PED_TO_DICOM.get(value, value)
+        return value
 
     def is_valid_xml(self, filepath=None):
         """Checks if the XML file is valid"""
@@ -1835,12 +987,11 @@ class SiemensMRImagingProtocol(MRImagingProtocol):
 
     def _collect_sequences_by_program(self, child):
         """Collects the sequence names by program name"""
-        toc = child.TOC.root.region.NormalExam_dot_engine.getchildren()
-        for program in toc:
+        for program in _xpath(_XPATH_PROGRAMS)(child):
             prog_name = program.get('name')
             self.programs[prog_name] = {}
             # get the sequences for each program
-            for protocol in program.getchildren():
+            for protocol in program:
                 seq_name = convert2ascii(protocol.get('name'))
                 self.programs[prog_name][seq_name] = dict(protocol.attrib)
 
@@ -1848,15 +999,15 @@ class SiemensMRImagingProtocol(MRImagingProtocol):
         """Collects the parameters by card"""
         if card.tag != 'Card':
             return cards_dict
-        for parameter in card.getchildren():
-            label = parameter.Label.text.strip()
+        # card names and labels repeat for every sequence in the file, so
+        # intern them to share one copy of each key
+        card_dict = cards_dict.setdefault(sys.intern(card.get('name')), {})
+        for parameter in card:
+            label = sys.intern(parameter.findtext('Label').strip())
             # TODO: Also add unit to the reference protocol
-            text = parameter.ValueAndUnit.text.strip()
+            text = parameter.findtext('ValueAndUnit').strip()
             value, unit = self._get_value_and_unit(text)
-            card_id = card.get('name')
-            if card_id not in cards_dict:
-                cards_dict[card_id] = {}
-            cards_dict[card_id][label] = auto_convert(value)
+            card_dict[label] = auto_convert(value)
         return cards_dict
 
     def from_xml(self, filepath=None):
@@ -1871,40 +1022,47 @@ class SiemensMRImagingProtocol(MRImagingProtocol):
 
         self.is_valid_xml(filepath)
 
-        # read the tree
-        tree = objectify.parse(filepath)
-        # get the root
-        root = tree.getroot()
-        # get the header title, which is the name of the scanner
-        # it is not used, but saved for future
-        self.header_title = root.PrintTOC.TOC.HeaderTitle
-
         # there are two types of children in the root
         # 1. PrintTOC : this is the table of contents
         # 2. PrintProtocol : this is the actual protocol
-        for child in root.getchildren():
+        # The file is read incrementally, and each child is discarded once it
+        # has been processed, so that the whole tree is never held in memory.
+        from lxml import etree
+        context = etree.iterparse(str(filepath), events=('end',),
+                                  tag=('PrintTOC', 'PrintProtocol'))
+        for _, child in context:
             if child.tag == 'PrintTOC':
+                # get the header title, which is the name of the scanner
+                # it is not used, but saved for future
+                self.header_title = _xpath(_XPATH_HEADER_TITLE)(child)
                 self._collect_sequences_by_program(child)
-            elif child.tag == 'PrintProtocol':
+            else:
                 # The protocol is organized into cards. Each card contains a set
                 # of parameters
-                protocol = child.Protocol
-                for step in protocol.getchildren():
-                    if step.tag != 'SubStep':
-                        continue
-
-                    hdr_path = step.ProtHeaderInfo.HeaderProtPath.text
-                    hdr_property = step.ProtHeaderInfo.HeaderProperty.text
-
-                    prog_name = hdr_path.split('\\')[-2]
-                    seq_name = convert2ascii(hdr_path.split('\\')[-1])
+                header_path = _xpath(_XPATH_HEADER_PATH)
+                header_property = _xpath(_XPATH_HEADER_PROPERTY)
+                for step in _xpath(_XPATH_SUBSTEPS)(child):
+                    hdr_path = header_path(step)
+                    hdr_property = header_property(step)
+
+                    # the path ends in ...\<program>\<sequence>
+                    rest, _, seq_name = hdr_path.rpartition('\\')
+                    prog_name = rest.rpartition('\\')[2]
+                    seq_name = convert2ascii(seq_name)
                     cards_dict = self.programs[prog_name][seq_name]
                     cards_dict['header_property'] = hdr_property
-                    for card in step.getchildren():
+                    for card in step:
                         cards_dict = self._collect_parameters(card, cards_dict)
+            child.clear()
+            while child.getprevious() is not None:
+                del child.getparent()[0]
 
 
 class ImagingSequence(BaseSequence, ABC):
+    # parameter classes for each set of parameter names, shared by all
+    # sequences, as most sequences in a dataset read the same parameters
+    _params_classes_cache = {}
+
     def __init__(self,
                  name='MRI',
                  dicom=None,
@@ -1916,9 +1074,9 @@ class ImagingSequence(BaseSequence, ABC):
 
         self.multi_echo = False
         self.params_classes = []
-        self.parameters = set(ACRONYMS_IMG.keys())
+        self.parameters = set(_IMAGING_PARAMS)
         self.store_demographics = store_demographics
-        self.demographics = set(ACRONYMS_DEMO.keys())
+        self.demographics = set(_DEMOGRAPHIC_PARAMS)
         super().__init__(name=name, path=path)
 
     def add_parameter(self, pname, value, module='protocol.imaging'):
@@ -1953,15 +1111,22 @@ class ImagingSequence(BaseSequence, ABC):
         """
         Initializes the parameter classes for the sequence.
         """
-        for p in self.parameters:
-            param_cls_name = f'protocol.imaging.{p}'
-            try:
-                cls_object = self.import_string(param_cls_name)
-            except ImportError:
-                raise ImportError(f'Parameter {param_cls_name} is not '
-                                  f'supported yet. '
-                                  f'Please raise a issue on GitHub.')
-            self.params_classes.append(cls_object)
+        key = frozenset(self.parameters)
+        classes = self._params_classes_cache.get(key)
+        if classes is None:
+            classes = []
+            for p in key:
+                param_cls_name = f'protocol.imaging.{p}'
+                try:
+                    cls_object = self.import_string(param_cls_name)
+                except ImportError:
+                    raise ImportError(f'Parameter {param_cls_name} is not '
+                                      f'supported yet. '
+                                      f'Please raise a issue on GitHub.')
+                classes.append(cls_object)
+            classes = tuple(classes)
+            self._params_classes_cache[key] = classes
+        self.params_classes.extend(classes)
 
     def from_dict(self, params_dict):
         """
@@ -1972,10 +1137,10 @@ class ImagingSequence(BaseSequence, ABC):
         params_dict : dict
             Dictionary containing the parameter names and values as key, value pairs.
         """
-        self.parameters = set(params_dict.keys())
+        self.parameters = set(params_dict)
 
         for pname, value in params_dict.items():
-            if isinstance(value, float) and np.isnan(value):
+            if isinstance(value, float) and isnan(value):
                 value = Unspecified
 
             if isinstance(value, BaseParameter):
@@ -1984,10 +1149,13 @@ class ImagingSequence(BaseSequence, ABC):
                 self.add_parameter(pname, value)
 
     @staticmethod
+    @functools.lru_cache(maxsize=None)
     def import_string(dotted_path):
         """
         Import a dotted module path and return the attribute/class designated by
         the last name in the path. Raise ImportError if the import failed.
+        Successful lookups are cached, as the same few parameter classes are
+        looked up for every sequence.
         """
 
         # TODO: if not able to search for the module, then find the class
@@ -2095,13 +1263,15 @@ class BidsImagingSequence(ImagingSequence):
             raise IOError('input bids file path does not exist!')
         bidsdata = read_json(bidsfile)
 
-        for pname in bidsdata.keys():
+        for pname, value in bidsdata.items():
             if pname in INVALID_PARAMETERS:
                 self.invalid_parameters.append(pname)
                 continue
             # check if an alternative name for the class exists
             pname_alter = ANALOGUES_DICT.get(pname, pname)
-            value = get_bids_param_value(bidsdata, pname)
+            # same as get_bids_param_value, without looking up pname again
+            if value is not None:
+                value = auto_convert(value)
 
             try:
                 self.add_parameter(pname_alter, value)
@@ -2153,14 +1323,17 @@ class DicomImagingSequence(ImagingSequence):
 
         self.multi_echo = False
         self.params_classes = []
-        self.parameters = set(ACRONYMS_IMG.keys())
+        self.parameters = set(_IMAGING_PARAMS)
         self.store_demographics = store_demographics
-        self.demographics = set(ACRONYMS_DEMO.keys())
+        self.demographics = set(_DEMOGRAPHIC_PARAMS)
         super().__init__(name=name, path=path)
 
         if self.parameters:
             self._init_param_classes()
         if dicom is not None:
+            if isinstance(dicom, Path):
+                # read the header once, instead of once per step below
+                dicom = load_header(dicom)
             self.parse(dicom)
             self._parse_private(dicom)
             self.set_session_info(dicom)
@@ -2198,6 +1371,7 @@ class DicomImagingSequence(ImagingSequence):
         Sets the session information from the DICOM header. This is used to
         set the session_id, subject_id, run_id and timestamp
         """
+        import pydicom
         if not isinstance(dicom, pydicom.FileDataset):
             raise TypeError('Input must be a pre-read pydicom object.')
 
@@ -2214,14 +1388,13 @@ class DicomImagingSequence(ImagingSequence):
         # TODO: time format varies across datasets. Find a way to
         #   reconcile differences and use it in timestamp
         if not isinstance(date, UnspecifiedType):
-            datetime_obj = datetime.strptime(date, '%Y%m%d')
-            self.timestamp = datetime_obj
+            self.timestamp = _content_date(date)
 
     def collect_demographics(self, dicom):
         if self.store_demographics:
             for pname in self.demographics:
                 value = get_dicom_param_value(dicom, pname,
-                                              tag_dict=SESSION_TAGS)
+                                              tag_dict=SESSION_TAG_KEYS)
                 self.add_parameter(pname, value)
 
     def parse(self, dicom, params=None):
@@ -2233,13 +1406,17 @@ class DicomImagingSequence(ImagingSequence):
             else:
                 self._init_param_classes()
 
+        import pydicom
         if not isinstance(dicom, pydicom.FileDataset):
             if not isinstance(dicom, Path):
                 raise ValueError('Input must be a pydicom FileDataset or Path')
             else:
                 if not dicom.exists():
                     raise IOError('input dicom path does not exist!')
-                dicom = pydicom.dcmread(dicom)
+                # only the tags of the parameters are read from the file
+                tags = [DICOM_TAG_KEYS[p] for p in self.parameters
+                        if p in DICOM_TAG_KEYS]
+                dicom = load_header(dicom, specific_tags=tags)
 
         for pname in self.parameters:
             # pname = param_class._name
@@ -2249,8 +1426,10 @@ class DicomImagingSequence(ImagingSequence):
     def _parse_private(self, dicom):
         """vendor specific private headers"""
 
-        if header_exists(dicom):
-            csa_header, csa_values = parse_csa_params(dicom)
+        csa_headers = read_csa_headers(dicom)
+        if csa_headers is not None:
+            csa_header, csa_values = parse_csa_params(dicom,
+                                                      csa_headers=csa_headers)
             for name, val in csa_values.items():
                 if name in self.parameters:
                     self.add_parameter(name, val)
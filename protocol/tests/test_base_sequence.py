@@ -4,7 +4,7 @@ from hypothesis import given, assume
 from hypothesis.strategies import text, dictionaries, floats
 
 from protocol import BaseSequence  # Replace with actual import path
-from protocol.base import NumericParameter
+from protocol.base import MultiValueNumericParameter, NumericParameter
 from protocol.config import Unspecified
 from protocol.utils import convert2ascii
 
@@ -67,6 +67,12 @@ def test_get_non_existing_parameter():
     assert default_value == "DefaultValue"
 
 
+def test_get_attribute_stored_as_none():
+    sequence = BaseSequence()
+    assert sequence["subject_id"] is None
+    assert sequence.get("subject_id", "DefaultValue") is None
+
+
 # Test equivalence and compliance
 @given(params_dict=dictionaries(text(), floats()))
 def test_equivalence_and_compliance(params_dict):
@@ -227,3 +233,36 @@ def test_string_representation_with_unspecified(parameter_name1,
                       f"{parameter_name1}={parameter_value1})")
             assert str(
                 sequence) == str_gt
+
+
+def test_string_representation_updates_after_changes():
+    sequence = BaseSequence()
+    sequence.add(NumericParameter(name='TR', value=2.0))
+    assert str(sequence) == 'Sequence(TR=2.0)'
+    sequence['TR'] = NumericParameter(name='TR', value=3.0)
+    assert str(sequence) == 'Sequence(TR=3.0)'
+    del sequence['TR']
+    assert str(sequence) == 'Sequence()'
+    sequence.name = 'Renamed'
+    assert str(sequence) == 'Renamed()'
+
+
+def test_numeric_compliance_rounds_to_decimals():
+    ref = NumericParameter(name='TR', value=2.0001)
+    assert ref.compliant(NumericParameter(name='TR', value=2.0004))
+    assert not ref.compliant(NumericParameter(name='TR', value=2.002))
+    assert ref.compliant(NumericParameter(name='TR', value=2.002),
+                         decimals=2)
+    assert ref.compliant(NumericParameter(name='TR', value=2.1), rtol=0.1)
+
+
+def test_multi_value_compliance_requires_same_length():
+    ref = MultiValueNumericParameter(name='TE', value=[2.0, 4.0])
+    assert ref.compliant(MultiValueNumericParameter(name='TE', value=[4.0, 2.0]))
+    assert not ref.compliant(MultiValueNumericParameter(name='TE', value=[2.0]))
+    assert not ref.compliant(
+        MultiValueNumericParameter(name='TE', value=[2.0, 4.0, 6.0]))
+
+
+def test_convert2ascii_unhashable_value():
+    assert convert2ascii(['Echo Time']) == convert2ascii(str(['Echo Time']))
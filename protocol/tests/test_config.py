@@ -0,0 +1,132 @@
+import atexit
+import json
+import logging
+import pickle
+import shutil
+from copy import deepcopy
+
+from protocol.config import (BufferedFileHandler, Invalid, InvalidType,
+                             ProtocolJSONEncoder, Unspecified, UnspecifiedType,
+                             configure_logger,
+                             is_invalid, is_unspecified, ACRONYM_TO_PARAM,
+                             ACRONYMS_IMAGING_PARAMETERS, PARAM_INDEX,
+                             BASE_IMAGING_PARAMETER_NAMES)
+
+
+def test_unspecified_is_singleton():
+    assert UnspecifiedType() is Unspecified
+    assert InvalidType() is Invalid
+    assert Invalid is not Unspecified
+    assert isinstance(Invalid, UnspecifiedType)
+    assert not hasattr(Unspecified, '__dict__')
+    assert deepcopy(Unspecified) is Unspecified
+    assert pickle.loads(pickle.dumps(Invalid)) is Invalid
+
+    assert hash(Unspecified) == hash(UnspecifiedType())
+
+
+def test_unspecified_checks():
+    assert is_unspecified(Unspecified)
+    assert is_unspecified(Invalid)
+    assert not is_unspecified({})
+    assert not is_unspecified(None)
+    assert is_invalid(Invalid)
+    assert not is_invalid(Unspecified)
+
+
+def test_unspecified_json_export():
+    data = {'EchoTime': Unspecified, 'FlipAngle': Invalid, 'TR': 2.0}
+    exported = json.dumps(data, cls=ProtocolJSONEncoder)
+    assert json.loads(exported) == {'EchoTime': {}, 'FlipAngle': {},
+                                    'TR': 2.0}
+
+
+def test_configure_logger_replaces_handlers(tmp_path):
+    log = logging.getLogger('protocol.tests.reconfigure')
+    configure_logger(log, output_dir=tmp_path / 'first', level='WARNING')
+    configure_logger(log, output_dir=tmp_path / 'second', level='WARNING')
+    assert len(log.handlers) == 1
+
+    log.warning('written once')
+    listener = log._queue_listener
+    atexit.unregister(listener.stop)
+    listener.stop()
+    for handler in listener.handlers:
+        handler.close()
+    text = (tmp_path / 'second' / '.protocol' / 'warn.log').read_text()
+    assert text.count('written once') == 1
+    assert not (tmp_path / 'first' / '.protocol' / 'warn.log').exists()
+
+
+def test_configure_logger_flushes_previous_file(tmp_path):
+    log = logging.getLogger('protocol.tests.flush_previous')
+    configure_logger(log, output_dir=tmp_path / 'first', level='WARNING')
+    log.warning('buffered warning')
+    # keep the file handler alive, so it is not flushed by garbage collection
+    file_handler = log._queue_listener.handlers[0].target
+    configure_logger(log, output_dir=tmp_path / 'second', level='WARNING')
+    assert file_handler.stream is None or file_handler.stream.closed
+    text = (tmp_path / 'first' / '.protocol' / 'warn.log').read_text()
+    assert 'buffered warning' in text
+
+    listener = log._queue_listener
+    atexit.unregister(listener.stop)
+    listener.stop()
+    for handler in listener.handlers:
+        handler.close()
+
+
+def test_configure_logger_keeps_caller_info(tmp_path):
+    log = logging.getLogger('protocol.tests.caller')
+    configure_logger(log, output_dir=tmp_path, level='ERROR')
+    records = []
+    # stands in for a handler of the application, e.g. on the root logger
+    catcher = logging.Handler()
+    catcher.emit = records.append
+    log.addHandler(catcher)
+    log.error('with caller')
+    log.removeHandler(catcher)
+    assert records[0].filename == 'test_config.py'
+    assert records[0].lineno > 0
+
+    listener = log._queue_listener
+    atexit.unregister(listener.stop)
+    listener.stop()
+    for handler in listener.handlers:
+        handler.close()
+
+
+def test_buffered_file_handler_is_not_reopened(tmp_path):
+    log_file = tmp_path / 'test.log'
+    handler = BufferedFileHandler(log_file, mode='w', delay=True)
+    handler.emit(logging.makeLogRecord({'msg': 'one'}))
+    handler.close()
+    handler.emit(logging.makeLogRecord({'msg': 'two'}))
+    handler.close()
+    assert log_file.read_text() == 'one\n'
+
+
+def test_configure_logger_recreates_log_dir(tmp_path):
+    log = logging.getLogger('protocol.tests.log_dir')
+    for _ in range(2):
+        configure_logger(log, output_dir=tmp_path, level='ERROR')
+        log.error('written after the folder was created')
+        listener = log._queue_listener
+        atexit.unregister(listener.stop)
+        listener.stop()
+        for handler in listener.handlers:
+            handler.close()
+        log.removeHandler(log._queue_handler)
+        log._queue_listener = None
+        log_file = tmp_path / '.protocol' / 'error.log'
+        assert 'written after' in log_file.read_text()
+        # e.g. a tmp cleaner removing the folder between runs
+        shutil.rmtree(tmp_path / '.protocol')
+
+
+def test_lookup_tables():
+    for name, acronym in ACRONYMS_IMAGING_PARAMETERS.items():
+        assert ACRONYMS_IMAGING_PARAMETERS[ACRONYM_TO_PARAM[acronym]] == acronym
+    assert ACRONYM_TO_PARAM['TR'] == 'RepetitionTime'
+    for idx, name in enumerate(BASE_IMAGING_PARAMETER_NAMES):
+        assert PARAM_INDEX[name] == idx
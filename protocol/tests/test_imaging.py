@@ -2,8 +2,16 @@
 import unittest
 from pathlib import Path
 
+import pytest
+
 from protocol import SiemensMRImagingProtocol
-from protocol.imaging import ReceiveCoilActiveElements, ImagingSequence
+from protocol.base import CategoricalParameter
+from protocol.config import (ACRONYMS_IMAGING_PARAMETERS,
+                             BASE_IMAGING_PARAMS_DICOM_TAGS)
+from protocol.imaging import (ReceiveCoilActiveElements, ImagingSequence,
+                              InPlanePhaseEncodingDirection,
+                              PhaseEncodingDirection, RepetitionTime,
+                              ShimSetting)
 from protocol.tests.conftest import THIS_DIR
 from protocol.tests.utils import download
 
@@ -189,6 +197,42 @@ def test_parse_receive_coil_active_elements():
         print(rcae.get_value())
 
 
+def test_parameter_class_attributes():
+    assert RepetitionTime._dicom_tag == \
+        BASE_IMAGING_PARAMS_DICOM_TAGS['RepetitionTime']
+    assert RepetitionTime._acronym == \
+        ACRONYMS_IMAGING_PARAMETERS['RepetitionTime']
+    param = RepetitionTime(2000)
+    assert param.dicom_tag == RepetitionTime._dicom_tag
+    assert param.acronym == RepetitionTime._acronym
+    # overridden tag, the shim settings are read from the private header
+    assert ShimSetting._dicom_tag is None
+    assert ShimSetting([1, 2]).dicom_tag is None
+
+
+def test_allowed_values_are_immutable():
+    # the allowed values are bound once by the factory and shared by all
+    # instances, so they must not be mutable
+    row = InPlanePhaseEncodingDirection('ROW')
+    col = InPlanePhaseEncodingDirection('COL')
+    assert row.allowed_values is col.allowed_values
+    assert isinstance(row.allowed_values, tuple)
+
+
+def test_invalid_phase_encoding_direction_message():
+    # allowed values are a set, the message lists them in a stable order
+    allowed = "['COL', 'ROW', 'i', 'i-', 'j', 'j-', 'k', 'k-']"
+    with pytest.raises(ValueError) as exc_info:
+        PhaseEncodingDirection('x')
+    assert str(exc_info.value).endswith(allowed)
+
+
+def test_invalid_value_message_mixed_allowed_values():
+    with pytest.raises(ValueError) as exc_info:
+        CategoricalParameter(name='X', value='z', allowed_values=(1, 'a'))
+    assert str(exc_info.value).endswith("[1, 'a']")
+
+
 def test_mr_protocol_xml_parsing():
     # Using an example XML file from the following Github repository
     # https://github.com/lrq3000/mri_protocol
@@ -32,6 +32,13 @@ dicom_params = dictionaries(
 
 # Add more tests based on the outlined property tests
 
+
+def test_init_from_path(sample_dcm):
+    from_path = DicomImagingSequence(dicom=Path(sample_dcm.filename))
+    from_dataset = DicomImagingSequence(dicom=sample_dcm)
+    assert from_path.name == from_dataset.name
+    assert from_path == from_dataset
+
 # Run tests
 if __name__ == '__main__':
     pytest.main()
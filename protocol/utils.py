@@ -1,20 +1,31 @@
+from __future__ import annotations
+
 import functools
 import json
 import re
+import sys
 import unicodedata
 import warnings
 from pathlib import Path
-from typing import Optional
-
-import pydicom
+from typing import TYPE_CHECKING, Optional
 
 from protocol import logger
 from protocol.config import (BASE_IMAGING_PARAMS_DICOM_TAGS as DICOM_TAGS,
+                             BASE_IMAGING_PARAMS_TAG_KEYS as DICOM_TAG_KEYS,
                              Unspecified, SLICE_MODE, PAT, SHIM, HEADER_TAGS)
 
-with warnings.catch_warnings():
-    warnings.filterwarnings('ignore')
-    from nibabel.nicom import csareader
+if TYPE_CHECKING:
+    import pydicom
+
+
+@functools.lru_cache(maxsize=None)
+def _csareader():
+    """Imports the CSA header reader from nibabel on first use only, as
+    importing nibabel is slow and only needed for Siemens DICOM headers"""
+    with warnings.catch_warnings():
+        warnings.filterwarnings('ignore')
+        from nibabel.nicom import csareader
+    return csareader
 
 
 def get_bids_param_value(bidsdata: dict,
@@ -58,7 +69,7 @@ def get_bids_param_value(bidsdata: dict,
 def get_dicom_param_value(dicom: pydicom.FileDataset,
                           name: str,
                           not_found_value=None,
-                          tag_dict=DICOM_TAGS):
+                          tag_dict=DICOM_TAG_KEYS):
     """
     Extracts value from dicom metadata looking up the corresponding HEX tag
     in DICOM_TAGS
@@ -66,7 +77,8 @@ def get_dicom_param_value(dicom: pydicom.FileDataset,
     Parameters
     ----------
     tag_dict: dict
-        dictionary containing tag name and corresponding HEX tag
+        dictionary containing tag name and corresponding HEX tag, either as a
+        (group, element) tuple or as an integer key
     dicom : pydicom.FileDataset
         dicom object read from pydicom.read_file
 
@@ -121,7 +133,8 @@ def safe_get(dictionary: dict, keys: str, default=None):
 
 
 def parse_csa_params(dicom: pydicom.FileDataset,
-                     not_found_value=None
+                     not_found_value=None,
+                     csa_headers=None
                      ):
     """
     Returns params parsed from private CSA header from Siemens scanner exported
@@ -135,14 +148,22 @@ def parse_csa_params(dicom: pydicom.FileDataset,
     not_found_value : object
         value to be returned if a parameter is not found
 
+    csa_headers : tuple
+        series and image headers, if already read with read_csa_headers
+
     Returns
     -------
     dict
         Contains PED, multi-slice mode, iPAT and shim_mode
 
     """
+    if csa_headers is None:
+        csa_header = _csareader().read(get_header(dicom, 'series_header_info'))
+        image_header = _csareader().read(get_header(dicom, 'image_header_info'))
+    else:
+        csa_header, image_header = csa_headers
+
     # series_header
-    csa_header = csareader.read(get_header(dicom, 'series_header_info'))
     items = safe_get(csa_header, 'tags.MrPhoenixProtocol.items')
     if items:
         text = items[0]
@@ -171,7 +192,6 @@ def parse_csa_params(dicom: pydicom.FileDataset,
     shim_setting = shim_first_order + shim_second_order
 
     # image_header
-    image_header = csareader.read(get_header(dicom, 'image_header_info'))
     phase_value = safe_get(image_header,
                            'tags.PhaseEncodingDirectionPositive.items')
     phpl = not_found_value
@@ -251,12 +271,33 @@ def get_csa_props(parameter, corpus):
     return -1
 
 
+def load_header(filepath, specific_tags=None) -> pydicom.FileDataset:
+    """
+    Reads the header of a DICOM file, skipping the pixel data which is
+    the bulk of the file and is never used to collect parameters.
+
+    Parameters
+    ----------
+    filepath : str or Path
+        path to the DICOM file
+
+    specific_tags : list, optional
+        if provided, only these tags are read from the file. By default,
+        the complete header is read, including the private headers.
+
+    Returns
+    -------
+    pydicom.FileDataset
+    """
+    import pydicom
+    return pydicom.dcmread(filepath, stop_before_pixels=True,
+                           specific_tags=specific_tags)
+
+
 # TODO : rename csa
-def header_exists(dicom: pydicom.FileDataset) -> bool:
+def read_csa_headers(dicom: pydicom.FileDataset):
     """
-    Check if the private SIEMENS header exists in the file or not. Some
-    parameters like effective_echo_spacing and shim method need the dicom
-    header to be present.
+    Reads the private SIEMENS (CSA) series and image headers.
 
     Parameters
     ----------
@@ -265,20 +306,20 @@ def header_exists(dicom: pydicom.FileDataset) -> bool:
 
     Returns
     -------
-    bool
+    tuple or None
+        series and image headers as parsed by nibabel, or None if the file has
+        no readable private header, e.g. for other vendors
     """
     try:
         series = get_header(dicom, 'series_header_info')
         image = get_header(dicom, 'image_header_info')
-        series_header = csareader.read(series)
-
+        series_header = _csareader().read(series)
+        image_header = _csareader().read(image)
         # just try reading these values, to bypass any errors,
         # don't need these values now
-        # image_header = \
-        csareader.read(image)
         # items = \
         series_header['tags']['MrPhoenixProtocol']['items'][0].split('\n')
-        return True
+        return series_header, image_header
     except Exception as e:
         logger.info(f'Expects dicom files from Siemens to be able to'
                     f' read the private header. For other vendors,'
@@ -286,7 +327,25 @@ def header_exists(dicom: pydicom.FileDataset) -> bool:
                     f'{e} in {dicom.filename}')
         # "Use --skip_private_header to create report".format(e))
         # raise e
-        return False
+        return None
+
+
+def header_exists(dicom: pydicom.FileDataset) -> bool:
+    """
+    Check if the private SIEMENS header exists in the file or not. Some
+    parameters like effective_echo_spacing and shim method need the dicom
+    header to be present.
+
+    Parameters
+    ----------
+    dicom : pydicom.FileDataset
+        dicom object read from pydicom.read_file
+
+    Returns
+    -------
+    bool
+    """
+    return read_csa_headers(dicom) is not None
 
 
 def get_effective_echo_spacing(dicom: pydicom.FileDataset,
@@ -329,6 +388,10 @@ def get_effective_echo_spacing(dicom: pydicom.FileDataset,
         return not_found_value
 
 
+_NOT_SLUG_CHARS = re.compile(r'[^\w\s-]')
+_DASHES_OR_SPACES = re.compile(r'[-\s]+')
+
+
 def convert2ascii(value, allow_unicode=False):
     """
     Taken from https://github.com/django/django/blob/master/django/utils/text.py
@@ -337,14 +400,21 @@ def convert2ascii(value, allow_unicode=False):
     underscores, or hyphens. Convert to lowercase. Also strip leading and
     trailing whitespace, dashes, and underscores.
     """
-    value = str(value)
+    return _convert2ascii(str(value), allow_unicode)
+
+
+@functools.lru_cache(maxsize=4096)
+def _convert2ascii(value, allow_unicode):
+    """Cached implementation of convert2ascii, as it is called with the same
+    few parameter and sequence names over and over. Takes the value as a
+    string, so that any input accepted by str() can be converted"""
     if allow_unicode:
         value = unicodedata.normalize('NFKC', value)
-    else:
+    elif not value.isascii():
         value = unicodedata.normalize(
             'NFKD', value).encode('ascii', 'ignore').decode('ascii')
-    value = re.sub(r'[^\w\s-]', '', value)
-    return re.sub(r'[-\s]+', '-', value).strip('-_')
+    value = _NOT_SLUG_CHARS.sub('', value)
+    return _DASHES_OR_SPACES.sub('-', value).strip('-_')
 
 
 def get_sequence_name(dicom: pydicom.FileDataset) -> str:
@@ -406,7 +476,9 @@ def auto_convert(s):
             continue
     if isinstance(s, str):
         return s.strip()
-    if isinstance(s, pydicom.valuerep.PersonName):
+    # a PersonName can only come from pydicom, if it has been imported already
+    pydicom = sys.modules.get('pydicom')
+    if pydicom is not None and isinstance(s, pydicom.valuerep.PersonName):
         return str(s)
     return s
 